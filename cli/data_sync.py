@@ -0,0 +1,269 @@
+import os
+import json
+import datetime
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import List, Optional
+
+import typer
+import yfinance as yf
+from rich.console import Console
+
+from tradingagents.dataflows.config import get_config, set_config
+from tradingagents.dataflows.interface import route_to_vendor
+from tradingagents.dataflows.price_store import open_price_store
+from tradingagents.dataflows.vendor_cache import is_cacheable
+from tradingagents.dataflows.vendor_metrics import export_metrics
+from tradingagents.dataflows.yfin_cache import (
+    append_yfin_bars,
+    get_download_end,
+    get_history_start,
+    get_yfin_store_path,
+    store_yfin_history,
+)
+
+console = Console()
+
+data_app = typer.Typer(help="Manage the local data caches used by the agents")
+
+# Per-ticker endpoints warmed through the vendor router, with the arguments the
+# agents' tools pass so the calls land on the same cache entries
+SYNC_ENDPOINTS = [
+    ("get_balance_sheet", lambda ticker, date: (ticker, "quarterly", date)),
+    ("get_cashflow", lambda ticker, date: (ticker, "quarterly", date)),
+    ("get_income_statement", lambda ticker, date: (ticker, "quarterly", date)),
+    ("get_insider_transactions", lambda ticker, date: (ticker, date)),
+]
+
+
+class SyncState:
+    """Progress of a sync run, saved after every step so an interrupted run can resume."""
+
+    def __init__(self, path: str, sync_date: str, resume: bool):
+        self.path = path
+        self.lock = threading.Lock()
+        self.state = {"date": sync_date, "prices": [], "endpoints": {}}
+        if resume and os.path.exists(path):
+            with open(path, "r") as f:
+                saved = json.load(f)
+            if saved.get("date") == sync_date:
+                self.state = saved
+
+    def prices_done(self, ticker: str) -> bool:
+        return ticker in self.state["prices"]
+
+    def endpoint_done(self, ticker: str, method: str) -> bool:
+        return method in self.state["endpoints"].get(ticker, [])
+
+    def mark_prices(self, tickers: List[str]) -> None:
+        with self.lock:
+            self.state["prices"].extend(t for t in tickers if t not in self.state["prices"])
+            self._save()
+
+    def mark_endpoint(self, ticker: str, method: str) -> None:
+        with self.lock:
+            self.state["endpoints"].setdefault(ticker, []).append(method)
+            self._save()
+
+    def _save(self) -> None:
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self.state, f)
+        os.replace(tmp_path, self.path)
+
+
+def _read_tickers(tickers: List[str], tickers_file: Optional[Path]) -> List[str]:
+    names = list(tickers)
+    if tickers_file is not None:
+        names.extend(tickers_file.read_text().replace(",", "\n").splitlines())
+    unique = []
+    for name in names:
+        name = name.strip().upper()
+        if name and not name.startswith("#") and name not in unique:
+            unique.append(name)
+    return unique
+
+
+def _batch_download(tickers: List[str], start_date: str):
+    return yf.download(
+        tickers,
+        start=start_date,
+        end=get_download_end(),
+        group_by="ticker",
+        progress=False,
+        auto_adjust=True,
+        actions=True,
+        threads=True,
+    )
+
+
+def _ticker_frame(data, ticker: str):
+    if data.columns.nlevels == 1:
+        # Single-ticker download without a ticker level
+        return data
+    if ticker not in data.columns.get_level_values(0):
+        return None
+    return data[ticker].dropna(how="all")
+
+
+def sync_prices(tickers: List[str], state: SyncState, batch_size: int) -> None:
+    """Bring every ticker's yfinance price store up to date with batched downloads."""
+    today = datetime.date.today().isoformat()
+    pending = [t for t in tickers if not state.prices_done(t)]
+
+    stale, missing = [], []
+    for ticker in pending:
+        store = open_price_store(get_yfin_store_path(ticker))
+        if store is None:
+            missing.append(ticker)
+        elif store.meta.get("refreshed_on") == today:
+            state.mark_prices([ticker])
+        else:
+            stale.append((ticker, store))
+
+    # Stores with history only need the bars since their last date
+    for i in range(0, len(stale), batch_size):
+        batch = stale[i:i + batch_size]
+        start_date = min(store.last_date for _, store in batch)
+        data = _batch_download([t for t, _ in batch], start_date)
+        done = []
+        for ticker, store in batch:
+            frame = _ticker_frame(data, ticker)
+            if frame is None or frame.empty:
+                console.print(f"[yellow]No recent prices for {ticker}[/yellow]")
+                done.append(ticker)
+            elif append_yfin_bars(ticker, store, frame) is None:
+                # A dividend or split changed the adjusted history
+                missing.append(ticker)
+            else:
+                done.append(ticker)
+        state.mark_prices(done)
+        console.print(f"Updated prices for {min(i + batch_size, len(stale))}/{len(stale)} cached tickers")
+
+    history_start = get_history_start()
+    for i in range(0, len(missing), batch_size):
+        batch = missing[i:i + batch_size]
+        data = _batch_download(batch, history_start)
+        for ticker in batch:
+            frame = _ticker_frame(data, ticker)
+            if store_yfin_history(ticker, frame, history_start) is None:
+                console.print(f"[yellow]No price history for {ticker}[/yellow]")
+        state.mark_prices(batch)
+        console.print(f"Downloaded full history for {min(i + batch_size, len(missing))}/{len(missing)} tickers")
+
+
+def sync_endpoints(tickers: List[str], sync_date: str, state: SyncState, workers: int) -> int:
+    """Call the per-ticker endpoints in parallel so their responses are cached.
+
+    A call only counts as done once the cache accepted its result, so vendor
+    errors are retried by the next run instead of being skipped on resume.
+
+    Returns:
+        int: number of calls that failed
+    """
+    jobs = [
+        (ticker, method, make_args(ticker, sync_date))
+        for ticker in tickers
+        for method, make_args in SYNC_ENDPOINTS
+        if not state.endpoint_done(ticker, method)
+    ]
+    failures = 0
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="sync") as executor:
+        futures = {
+            executor.submit(route_to_vendor, method, *args): (ticker, method)
+            for ticker, method, args in jobs
+        }
+        for done, future in enumerate(as_completed(futures), start=1):
+            ticker, method = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                failures += 1
+                console.print(f"[red]{method} failed for {ticker}: {e}[/red]")
+            else:
+                if is_cacheable(result):
+                    state.mark_endpoint(ticker, method)
+                else:
+                    failures += 1
+                    console.print(f"[red]{method} returned no cacheable data for {ticker}[/red]")
+            if done % 50 == 0 or done == len(futures):
+                console.print(f"Fetched {done}/{len(futures)} endpoint calls")
+    return failures
+
+
+def build_indexes(tickers: List[str]) -> None:
+    """Rebuild the derived indexes over the synced and local data."""
+    from tradingagents.dataflows.config import DATA_DIR
+    from tradingagents.dataflows.indicator_cube import build_indicator_cube
+    from tradingagents.dataflows.reddit_utils import build_reddit_index
+    from tradingagents.dataflows.finnhub_utils import build_finnhub_cache
+    from tradingagents.dataflows.simfin_store import build_simfin_stores
+
+    steps = [
+        ("indicator cube", lambda: build_indicator_cube(tickers)),
+        ("reddit index", lambda: build_reddit_index(os.path.join(DATA_DIR, "reddit_data"))),
+        ("finnhub cache", lambda: build_finnhub_cache(DATA_DIR)),
+        ("simfin store", lambda: build_simfin_stores(DATA_DIR)),
+    ]
+    for name, build in steps:
+        try:
+            build()
+            console.print(f"Built {name}")
+        except Exception as e:
+            console.print(f"[yellow]Skipped {name}: {e}[/yellow]")
+
+
+@data_app.command("sync")
+def sync(
+    tickers: List[str] = typer.Argument(None, help="Tickers to sync"),
+    tickers_file: Optional[Path] = typer.Option(
+        None, "--file", "-f", exists=True, dir_okay=False, help="File with one ticker per line"
+    ),
+    date: Optional[str] = typer.Option(
+        None, "--date", "-d", help="Trade date the agents will run for, YYYY-MM-DD (default: today)"
+    ),
+    workers: int = typer.Option(8, "--workers", "-w", help="Parallel workers for per-ticker endpoints"),
+    batch_size: int = typer.Option(100, "--batch-size", help="Tickers per batched price download"),
+    resume: bool = typer.Option(True, "--resume/--restart", help="Skip steps finished by an interrupted run"),
+    indexes: bool = typer.Option(False, "--build-indexes", help="Also rebuild the indicator cube and local data indexes"),
+    metrics_file: Optional[Path] = typer.Option(
+        None, "--metrics-file", dir_okay=False, help="Write vendor call metrics here (.prom for Prometheus text, otherwise JSON)"
+    ),
+):
+    """Prefetch prices, statements and insider data for a ticker universe."""
+    names = _read_tickers(tickers or [], tickers_file)
+    if not names:
+        console.print("[red]No tickers given[/red]")
+        raise typer.Exit(code=1)
+
+    sync_date = date or datetime.date.today().isoformat()
+    try:
+        datetime.datetime.strptime(sync_date, "%Y-%m-%d")
+    except ValueError:
+        console.print("[red]Error: Invalid date format. Please use YYYY-MM-DD[/red]")
+        raise typer.Exit(code=1)
+
+    # The endpoint responses are only kept if the vendor cache is on
+    cache_config = get_config()["vendor_cache"]
+    if not cache_config.get("enabled", False):
+        set_config({"vendor_cache": {**cache_config, "enabled": True}})
+
+    state_path = os.path.join(get_config()["data_cache_dir"], "data_sync_state.json")
+    state = SyncState(state_path, sync_date, resume)
+
+    console.print(f"Syncing {len(names)} tickers for {sync_date}")
+    sync_prices(names, state, batch_size)
+    failures = sync_endpoints(names, sync_date, state, workers)
+    if indexes:
+        build_indexes(names)
+    if metrics_file is not None:
+        fmt = "prometheus" if metrics_file.suffix == ".prom" else "json"
+        metrics_file.write_text(export_metrics(fmt))
+        console.print(f"Wrote vendor metrics to {metrics_file}")
+
+    if failures:
+        console.print(f"[yellow]Sync finished with {failures} failed calls; rerun to retry them[/yellow]")
+        raise typer.Exit(code=1)
+    console.print("[green]Sync complete[/green]")
@@ -28,6 +28,7 @@ from tradingagents.graph.trading_graph import TradingAgentsGraph
 from tradingagents.default_config import DEFAULT_CONFIG
 from cli.models import AnalystType
 from cli.utils import *
+from cli.data_sync import data_app
 
 console = Console()
 
@@ -36,6 +37,7 @@ app = typer.Typer(
     help="TradingAgents CLI: Multi-Agents LLM Financial Trading Framework",
     add_completion=True,  # Enable shell completion
 )
+app.add_typer(data_app, name="data")
 
 
 # Create a deque to store recent messages with a maximum length
@@ -843,7 +845,10 @@ def run_analysis():
         init_agent_state = graph.propagator.create_initial_state(
             selections["ticker"], selections["analysis_date"]
         )
-        args = graph.propagator.get_graph_args()
+        args = graph.get_graph_args(
+            selections["ticker"], selections["analysis_date"]
+        )
+        graph.discard_checkpoint(selections["ticker"], selections["analysis_date"])
 
         # Stream the analysis
         trace = []
@@ -1077,6 +1082,8 @@ def run_analysis():
 
             trace.append(chunk)
 
+        graph.prune_checkpoint(selections["ticker"], selections["analysis_date"])
+
         # Get final state and decision
         final_state = trace[-1]
         decision = graph.process_signal(final_state["final_trade_decision"])
@@ -1100,6 +1107,13 @@ def run_analysis():
         update_display(layout)
 
 
+@app.callback(invoke_without_command=True)
+def main(ctx: typer.Context):
+    # Run the analysis when no subcommand is given, as before the data commands existed
+    if ctx.invoked_subcommand is None:
+        run_analysis()
+
+
 @app.command()
 def analyze():
     run_analysis()
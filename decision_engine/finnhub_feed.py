@@ -4,6 +4,8 @@ from dotenv import load_dotenv
 import pandas as pd
 from datetime import datetime, timedelta
 
+from tradingagents.dataflows.config import get_config
+
 load_dotenv()
 
 FINNHUB_API_KEY = os.getenv("FINNHUB_API_KEY") 
@@ -27,7 +29,7 @@ def get_historical_prices(symbol, lookback=60, interval='D'):
     if symbol_fx == "BTCUSD":
         symbol_fx = "BINANCE:BTCUSDT"
     url = f"{FINNHUB_BASE}/crypto/candle?symbol={symbol_fx}&resolution={interval}&from={from_unix}&to={to_unix}&token={FINNHUB_API_KEY}"
-    resp = requests.get(url)
+    resp = requests.get(url, timeout=get_config().get("http_timeout_seconds", 30))
     data = resp.json()
     if data.get("s") != "ok":
         raise Exception(f"Finnhub data error: {data.get('s', '')}")
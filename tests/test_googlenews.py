@@ -0,0 +1,53 @@
+import asyncio
+
+import pytest
+
+from tradingagents.dataflows import config as dataflow_config
+from tradingagents.dataflows import googlenews_utils
+from tradingagents.dataflows.config import get_config, set_config
+
+
+def scrape(monkeypatch, tmp_path, pages_with_next):
+    saved = dataflow_config._config.copy()
+    set_config({
+        "data_cache_dir": str(tmp_path),
+        "google_news": {**get_config().get("google_news", {}), "max_concurrency": 3, "max_pages": None},
+    })
+    requested = []
+
+    async def fetch_page(url, semaphore, settings):
+        page = int(url.rsplit("start=", 1)[1]) // 10
+        requested.append(page)
+        return [{"title": f"page {page}"}], page < pages_with_next
+
+    monkeypatch.setattr(googlenews_utils, "_afetch_page", fetch_page)
+    try:
+        results = asyncio.run(googlenews_utils.agetNewsData("NVDA", "2024-05-01", "2024-05-10"))
+    finally:
+        dataflow_config._config = saved
+    return requested, results
+
+
+def test_a_single_page_search_makes_one_request(monkeypatch, tmp_path):
+    requested, results = scrape(monkeypatch, tmp_path, pages_with_next=0)
+    assert requested == [0]
+    assert results == [{"title": "page 0"}]
+
+
+def test_later_pages_are_fetched_concurrently_once_page_0_has_a_next_page(monkeypatch, tmp_path):
+    requested, results = scrape(monkeypatch, tmp_path, pages_with_next=2)
+    assert requested == [0, 1, 2, 3]
+    assert [r["title"] for r in results] == ["page 0", "page 1", "page 2"]
+
+
+def test_errors_inside_a_running_event_loop_reach_the_caller(monkeypatch):
+    async def failing(query, start_date, end_date):
+        raise ValueError("blocked")
+
+    monkeypatch.setattr(googlenews_utils, "agetNewsData", failing)
+
+    async def call_from_loop():
+        googlenews_utils.getNewsDataConcurrent("NVDA", "2024-05-01", "2024-05-10")
+
+    with pytest.raises(ValueError, match="blocked"):
+        asyncio.run(call_from_loop())
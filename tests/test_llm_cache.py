@@ -0,0 +1,133 @@
+import copy
+from datetime import datetime
+from typing import Optional
+from uuid import uuid4
+
+import pandas as pd
+import pytest
+
+trading_graph = pytest.importorskip("tradingagents.graph.trading_graph")
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, ToolMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.utils.function_calling import convert_to_openai_tool
+
+from tradingagents.dataflows import config as dataflow_config
+from tradingagents.dataflows import y_finance
+from tradingagents.default_config import DEFAULT_CONFIG
+
+provider_calls = []
+
+
+class ScriptedChatModel(BaseChatModel):
+    """Chat model that requests stock data once, then answers; every call is counted."""
+
+    model: str = "scripted"
+    base_url: Optional[str] = None
+
+    @property
+    def _llm_type(self) -> str:
+        return "scripted"
+
+    def bind_tools(self, tools, **kwargs):
+        return self.bind(tools=[convert_to_openai_tool(t) for t in tools], **kwargs)
+
+    def _generate(self, messages, stop=None, run_manager=None, tools=None, **kwargs):
+        provider_calls.append(len(messages))
+        if tools and not any(isinstance(m, ToolMessage) for m in messages):
+            message = AIMessage(
+                content="",
+                tool_calls=[{
+                    "name": "get_stock_data",
+                    "args": {"symbol": "NVDA", "start_date": "2024-05-01", "end_date": "2024-05-10"},
+                    "id": f"call_{uuid4().hex}",
+                }],
+            )
+        else:
+            message = AIMessage(
+                content=f"Report from {len(messages)} messages. FINAL TRANSACTION PROPOSAL: **BUY**"
+            )
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+
+class NoMemory:
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def get_memories(self, situation, n_matches=1):
+        return []
+
+
+class Ticker:
+    def __init__(self, symbol):
+        pass
+
+    def history(self, start, end):
+        index = pd.date_range("2024-05-01", periods=5, freq="B", name="Date")
+        return pd.DataFrame({"Open": 1.0, "High": 2.0, "Low": 0.5, "Close": 1.5, "Volume": 100}, index=index)
+
+
+class TickingClock(datetime):
+    """Every call to now() is a second later, like separate runs would see."""
+
+    ticks = 0
+
+    @classmethod
+    def now(cls, tz=None):
+        cls.ticks += 1
+        return datetime(2024, 5, 10, 9, 0) + pd.Timedelta(seconds=cls.ticks)
+
+
+@pytest.fixture
+def graph(tmp_path, monkeypatch):
+    saved = dataflow_config._config.copy()
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(trading_graph, "ChatOpenAI", ScriptedChatModel)
+    monkeypatch.setattr(trading_graph, "FinancialSituationMemory", NoMemory)
+    monkeypatch.setattr(y_finance, "load_yfin_history", lambda *args: None)
+    monkeypatch.setattr(y_finance.yf, "Ticker", Ticker, raising=False)
+    monkeypatch.setattr(y_finance, "datetime", TickingClock)
+
+    config = copy.deepcopy(DEFAULT_CONFIG)
+    config.update({
+        "project_dir": str(tmp_path),
+        "results_dir": str(tmp_path / "results"),
+        "data_cache_dir": str(tmp_path / "cache"),
+        "llm_cache": {"enabled": True, "path": str(tmp_path / "llm_cache.sqlite"), "max_size_mb": 16},
+    })
+    config["data_vendors"] = {**config["data_vendors"], "core_stock_apis": "yfinance"}
+    yield trading_graph.TradingAgentsGraph(["market"], config=config)
+    dataflow_config._config = saved
+
+
+def test_rerunning_the_same_propagate_is_served_from_the_cache(graph):
+    graph.propagate("NVDA", "2024-05-10")
+    first = graph.get_llm_cache_stats()
+    assert first["misses"] > 0
+    calls_after_first_run = len(provider_calls)
+
+    graph.propagate("NVDA", "2024-05-10")
+    second = graph.get_llm_cache_stats()
+    assert second["misses"] == first["misses"]
+    assert second["hits"] == first["misses"]
+    assert len(provider_calls) == calls_after_first_run
+
+
+def test_running_size_tracks_replacements_and_eviction(tmp_path):
+    from langchain_core.outputs import Generation
+
+    from tradingagents.graph.llm_cache import SQLiteLLMCache
+
+    cache = SQLiteLLMCache(str(tmp_path / "llm_cache.sqlite"), max_size_mb=0.01)
+    for i in range(20):
+        cache.update(f"prompt {i}", "llm", [Generation(text="x" * 1000)])
+    cache.update("prompt 19", "llm", [Generation(text="y" * 2000)])
+
+    size = cache.stats()["size_bytes"]
+    assert cache._total_bytes == size
+    assert size <= cache.max_bytes
+    assert cache.lookup("prompt 19", "llm")[0].text == "y" * 2000
+
+    reopened = SQLiteLLMCache(str(tmp_path / "llm_cache.sqlite"), max_size_mb=0.01)
+    assert reopened._total_bytes == size
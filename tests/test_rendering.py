@@ -0,0 +1,36 @@
+from tradingagents.dataflows import config as dataflow_config
+from tradingagents.dataflows.config import get_config, set_config
+from tradingagents.dataflows.rendering import render_tool_results
+
+
+def with_budget(max_tokens):
+    set_config({"tool_output_budget": {**get_config()["tool_output_budget"], "enabled": True, "max_tokens": max_tokens}})
+
+
+def test_a_long_source_does_not_push_out_the_ones_after_it():
+    saved = dataflow_config._config.copy()
+    try:
+        with_budget(100)
+        finnhub = "## Finnhub\n" + "finnhub headline\n" * 200
+        reddit = "## Reddit\nreddit post\n"
+        google = "## Google\n" + "google headline\n" * 200
+        output = render_tool_results("get_news", [finnhub, reddit, google])
+    finally:
+        dataflow_config._config = saved
+
+    assert "reddit post" in output
+    assert "## Google" in output and "google headline" in output
+    assert "of source 1 of 3 to fit" in output
+    assert "of source 3 of 3 to fit" in output
+    assert "source 2 of 3" not in output
+    assert len(output) < 100 * 4 + 200
+
+
+def test_without_a_budget_results_are_joined_unchanged():
+    saved = dataflow_config._config.copy()
+    try:
+        set_config({"tool_output_budget": {"enabled": False}})
+        assert render_tool_results("get_news", ["a", "b"]) == "a\nb"
+        assert render_tool_results("get_news", ["only"]) == "only"
+    finally:
+        dataflow_config._config = saved
@@ -0,0 +1,32 @@
+import os
+
+import pandas as pd
+
+from tradingagents.dataflows import simfin_store
+
+
+def write_balance_sheet(data_dir):
+    path = simfin_store._csv_path("balance_sheet", "quarterly", str(data_dir))
+    os.makedirs(os.path.dirname(path))
+    pd.DataFrame({
+        "Ticker": ["NVDA", "NVDA", "AAPL"],
+        "SimFinId": [1, 1, 2],
+        "Report Date": ["2023-12-31", "2024-03-31", "2024-03-31"],
+        "Publish Date": ["2024-02-20", "2024-05-20", "2024-05-01"],
+        "Total Assets": [10, 20, 30],
+    }).to_csv(path, sep=";", index=False)
+
+
+def test_lookups_use_the_csv_until_the_store_is_built(tmp_path):
+    write_balance_sheet(tmp_path)
+    data_dir = str(tmp_path)
+
+    before = simfin_store.get_latest_statement("balance_sheet", "NVDA", "quarterly", "2024-05-10", data_dir)
+    assert before["Total Assets"] == 10
+    assert not os.path.exists(simfin_store._store_dir("balance_sheet", "quarterly", data_dir))
+
+    assert simfin_store.build_simfin_stores(data_dir) == [("balance_sheet", "quarterly")]
+    after = simfin_store.get_latest_statement("balance_sheet", "NVDA", "quarterly", "2024-05-10", data_dir)
+    assert after.equals(before)
+    assert simfin_store.get_latest_statement("balance_sheet", "NVDA", "quarterly", "2024-01-01", data_dir) is None
+    assert simfin_store.get_latest_statement("balance_sheet", "MSFT", "quarterly", "2024-05-10", data_dir) is None
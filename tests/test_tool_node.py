@@ -0,0 +1,53 @@
+import time
+
+import pytest
+
+ConcurrentToolNode = pytest.importorskip("tradingagents.graph.tool_node").ConcurrentToolNode
+
+from langchain_core.messages import AIMessage
+from langchain_core.tools import tool
+
+
+@tool
+def slow_tool(seconds: float) -> str:
+    """Sleep for the given number of seconds."""
+    time.sleep(seconds)
+    return f"slept {seconds}"
+
+
+def state_with_calls(*durations):
+    calls = [
+        {"name": "slow_tool", "args": {"seconds": seconds}, "id": f"call_{i}"}
+        for i, seconds in enumerate(durations)
+    ]
+    return {"messages": [AIMessage(content="", tool_calls=calls)]}
+
+
+def test_queued_calls_are_not_charged_for_waiting():
+    node = ConcurrentToolNode([slow_tool], max_workers=1, timeout=0.5)
+    messages = node.invoke(state_with_calls(0.2, 0.2, 0.2))["messages"]
+    assert [m.content for m in messages] == ["slept 0.2"] * 3
+    assert [m.tool_call_id for m in messages] == ["call_0", "call_1", "call_2"]
+
+
+def test_timed_out_call_does_not_starve_later_calls():
+    node = ConcurrentToolNode([slow_tool], max_workers=1, timeout=0.2)
+    messages = node.invoke(state_with_calls(1.0, 0.05))["messages"]
+    assert messages[0].status == "error"
+    assert "timed out" in messages[0].content
+    assert messages[1].content == "slept 0.05"
+
+    messages = node.invoke(state_with_calls(0.05))["messages"]
+    assert messages[0].content == "slept 0.05"
+
+
+async def run_async(node, state):
+    return await node.ainvoke(state)
+
+
+def test_async_path_starts_the_clock_when_a_call_runs():
+    import asyncio
+
+    node = ConcurrentToolNode([slow_tool], max_workers=1, timeout=0.5)
+    messages = asyncio.run(run_async(node, state_with_calls(0.2, 0.2, 0.2)))["messages"]
+    assert [m.content for m in messages] == ["slept 0.2"] * 3
@@ -0,0 +1,63 @@
+import time
+
+from tradingagents.dataflows.vendor_cache import ErrorResult, VendorCache, is_cacheable
+
+
+def make_cache(tmp_path, max_size_mb=1.0):
+    return VendorCache(
+        str(tmp_path / "vendor_cache.db"),
+        max_size_mb,
+        {"news_data": 3600, "get_insider_transactions": 24 * 3600},
+    )
+
+
+def test_error_results_are_never_cached(tmp_path):
+    cache = make_cache(tmp_path)
+    window = ErrorResult("## rsi values from 2024-01-01 to 2024-01-31:\n\nError retrieving rsi data: timeout\n")
+    cache.put("indicator", "get_indicators", "technical_indicators", window, historical=True)
+    cache.put("missing", "get_stock_data", "core_stock_apis", ErrorResult("No data found for symbol 'XYZ'"), historical=True)
+    cache.put("error", "get_news", "news_data", "Error: upstream failed", historical=False)
+
+    assert cache.get("indicator", "technical_indicators") == (False, None)
+    assert cache.get("missing", "core_stock_apis") == (False, None)
+    assert cache.get("error", "news_data") == (False, None)
+    assert cache.stats()["entries"] == 0
+
+
+def test_successful_results_are_cached(tmp_path):
+    cache = make_cache(tmp_path)
+    cache.put("news", "get_news", "news_data", "headline", historical=False)
+    assert cache.get("news", "news_data") == (True, "headline")
+
+
+def test_running_size_tracks_replacements_and_eviction(tmp_path):
+    cache = make_cache(tmp_path, max_size_mb=0.01)
+    for i in range(20):
+        cache.put(f"key{i}", "get_news", "news_data", "x" * 1000, historical=True)
+    cache.put("key19", "get_news", "news_data", "y" * 2000, historical=True)
+
+    size = cache.stats()["size_bytes"]
+    assert cache._total_bytes == size
+    assert size <= cache.max_bytes
+    assert cache.get("key19", "news_data") == (True, "y" * 2000)
+
+    reopened = make_cache(tmp_path, max_size_mb=0.01)
+    assert reopened._total_bytes == size
+
+
+def test_method_ttl_overrides_category_ttl(tmp_path, monkeypatch):
+    cache = make_cache(tmp_path)
+    cache.put("news", "get_news", "news_data", "headline", historical=False)
+    cache.put("insider", "get_insider_transactions", "news_data", "filings", historical=False)
+
+    later = time.time() + 2 * 3600
+    monkeypatch.setattr("tradingagents.dataflows.vendor_cache.time.time", lambda: later)
+    assert cache.get("news", "news_data") == (False, None)
+    assert cache.get("insider", "news_data") == (True, "filings")
+
+
+def test_is_cacheable():
+    assert is_cacheable("data")
+    assert not is_cacheable("")
+    assert not is_cacheable(None)
+    assert not is_cacheable(ErrorResult("No data found for symbol 'XYZ'"))
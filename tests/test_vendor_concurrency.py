@@ -0,0 +1,17 @@
+import pytest
+
+interface = pytest.importorskip("tradingagents.dataflows.interface")
+
+
+def test_google_news_scraper_is_limited_as_google_from_any_vendor():
+    local_impls = interface.VENDOR_METHODS["get_news"]["local"]
+    assert interface.get_google_news in local_impls
+    assert interface._get_service(interface.get_google_news, "local") == "google"
+    assert interface._get_service(interface.get_google_news, "google") == "google"
+    assert interface._get_service(interface.get_finnhub_news, "local") == "local"
+
+
+def test_vendors_sharing_a_service_share_its_semaphore():
+    assert interface._get_service_semaphore("google") is interface._get_service_semaphore(
+        interface._get_service(interface.get_google_news, "local")
+    )
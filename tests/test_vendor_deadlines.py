@@ -0,0 +1,77 @@
+import threading
+import time
+
+import pytest
+
+interface = pytest.importorskip("tradingagents.dataflows.interface")
+
+from tradingagents.dataflows import config as dataflow_config
+from tradingagents.dataflows.config import get_config, set_config
+
+
+@pytest.fixture
+def release():
+    event = threading.Event()
+    yield event
+    event.set()
+
+
+@pytest.fixture(autouse=True)
+def single_worker_pool(monkeypatch):
+    """Route fake_method through a one-worker pool with a short deadline."""
+    saved = dataflow_config._config.copy()
+    set_config({
+        "vendor_max_workers": 1,
+        "vendor_deadlines": {"default": 0.2},
+        "vendor_cache": {**get_config()["vendor_cache"], "enabled": False},
+        "parallel_vendor_calls": False,
+    })
+    monkeypatch.setattr(interface, "_executor", None)
+    monkeypatch.setattr(interface, "get_category_for_method", lambda method: "news_data")
+    yield
+    dataflow_config._config = saved
+
+
+def test_fallback_does_not_queue_behind_an_abandoned_call(monkeypatch, release):
+    def hung(*args, **kwargs):
+        release.wait(5)
+        return "late"
+
+    monkeypatch.setitem(
+        interface.VENDOR_METHODS, "fake_method", {"slow": hung, "fast": lambda: "fresh"}
+    )
+    monkeypatch.setattr(interface, "get_vendor", lambda category, method: "slow,fast")
+
+    assert interface.route_to_vendor("fake_method") == "fresh"
+
+
+def test_time_queued_for_a_service_slot_is_not_a_timeout(monkeypatch):
+    from concurrent.futures import ThreadPoolExecutor
+
+    from tradingagents.dataflows import vendor_health
+
+    set_config({
+        "vendor_max_workers": 8,
+        "vendor_deadlines": {"default": 0.5},
+        "vendor_concurrency_limits": {"default": 1},
+        "vendor_health": {**get_config()["vendor_health"], "enabled": True, "failure_threshold": 3},
+    })
+    monkeypatch.setattr(interface, "_service_semaphores", {})
+    vendor_health.reset_vendor_stats()
+
+    def steady(*args, **kwargs):
+        time.sleep(0.3)
+        return "data"
+
+    monkeypatch.setitem(interface.VENDOR_METHODS, "fake_method", {"steady": steady})
+    monkeypatch.setattr(interface, "get_vendor", lambda category, method: "steady")
+
+    with ThreadPoolExecutor(max_workers=4) as callers:
+        results = list(callers.map(lambda _: interface.route_to_vendor("fake_method"), range(4)))
+
+    assert results == ["data"] * 4
+    stats = vendor_health.get_vendor_stats()["fake_method/steady"]
+    assert stats["circuit"] == "closed"
+    assert stats["failures"] == 0
+    assert stats["p95_latency"] < 0.5
+    vendor_health.reset_vendor_stats()
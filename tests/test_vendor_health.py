@@ -0,0 +1,116 @@
+import pytest
+import requests
+
+from tradingagents.dataflows import config as dataflow_config
+from tradingagents.dataflows import vendor_health
+from tradingagents.dataflows.config import get_config, set_config
+
+
+@pytest.fixture(autouse=True)
+def breaker(monkeypatch):
+    """Enable the circuit breaker with a short cooldown and a fake clock."""
+    saved = dataflow_config._config.copy()
+    set_config({
+        "vendor_health": {
+            **get_config()["vendor_health"],
+            "enabled": True,
+            "failure_threshold": 3,
+            "cooldown_seconds": 60,
+        }
+    })
+    clock = {"now": 1000.0}
+    monkeypatch.setattr(vendor_health.time, "monotonic", lambda: clock["now"])
+    vendor_health.reset_vendor_stats()
+    yield clock
+    vendor_health.reset_vendor_stats()
+    dataflow_config._config = saved
+
+
+def fail(vendor="alpha_vantage", transient=True):
+    vendor_health.record_call("get_news", vendor, 0.1, False, transient)
+
+
+def test_circuit_opens_after_consecutive_transient_failures():
+    for _ in range(2):
+        fail()
+        assert vendor_health.allow_call("get_news", "alpha_vantage")
+    fail()
+    assert not vendor_health.allow_call("get_news", "alpha_vantage")
+    assert vendor_health.get_vendor_stats()["get_news/alpha_vantage"]["circuit"] == "open"
+
+
+def test_missing_data_failures_never_open_the_circuit():
+    for _ in range(10):
+        fail(vendor="local", transient=False)
+    assert vendor_health.allow_call("get_news", "local")
+    stats = vendor_health.get_vendor_stats()["get_news/local"]
+    assert stats["circuit"] == "closed"
+    assert stats["failures"] == 10
+
+
+def test_half_open_lets_a_single_trial_through(breaker):
+    for _ in range(3):
+        fail()
+    breaker["now"] += 61
+    assert vendor_health.allow_call("get_news", "alpha_vantage")
+    # The trial is out; nothing else gets through until it reports back
+    assert not vendor_health.allow_call("get_news", "alpha_vantage")
+    assert vendor_health.get_vendor_stats()["get_news/alpha_vantage"]["circuit"] == "half_open"
+
+
+def test_successful_trial_closes_the_circuit(breaker):
+    for _ in range(3):
+        fail()
+    breaker["now"] += 61
+    assert vendor_health.allow_call("get_news", "alpha_vantage")
+    vendor_health.record_call("get_news", "alpha_vantage", 0.1, True)
+    assert vendor_health.allow_call("get_news", "alpha_vantage")
+    assert vendor_health.allow_call("get_news", "alpha_vantage")
+    assert vendor_health.get_vendor_stats()["get_news/alpha_vantage"]["circuit"] == "closed"
+
+
+def test_failed_trial_reopens_the_circuit(breaker):
+    for _ in range(3):
+        fail()
+    breaker["now"] += 61
+    assert vendor_health.allow_call("get_news", "alpha_vantage")
+    fail()
+    assert not vendor_health.allow_call("get_news", "alpha_vantage")
+    breaker["now"] += 61
+    assert vendor_health.allow_call("get_news", "alpha_vantage")
+
+
+def test_disabled_breaker_always_allows_calls():
+    set_config({"vendor_health": {**get_config()["vendor_health"], "enabled": False}})
+    for _ in range(5):
+        fail()
+    assert vendor_health.allow_call("get_news", "alpha_vantage")
+
+
+def test_transient_error_classification():
+    assert vendor_health.is_transient_error(requests.exceptions.ConnectTimeout())
+    assert vendor_health.is_transient_error(TimeoutError())
+    assert not vendor_health.is_transient_error(FileNotFoundError("no data for ticker"))
+    assert not vendor_health.is_transient_error(ValueError("bad symbol"))
+
+
+def test_missing_data_does_not_lock_out_a_vendor(monkeypatch):
+    interface = pytest.importorskip("tradingagents.dataflows.interface")
+    set_config({"vendor_cache": {**get_config()["vendor_cache"], "enabled": False}})
+
+    def missing(symbol):
+        raise FileNotFoundError(f"no local file for {symbol}")
+
+    def found(symbol):
+        return f"data for {symbol}"
+
+    monkeypatch.setattr(interface, "get_category_for_method", lambda method: "news_data")
+    monkeypatch.setattr(interface, "get_vendor", lambda category, method: "local")
+
+    # Missing data for unknown tickers must not lock out the vendor
+    monkeypatch.setitem(interface.VENDOR_METHODS, "fake_method", {"local": missing})
+    for symbol in ("AAA", "BBB", "CCC"):
+        with pytest.raises(RuntimeError):
+            interface.route_to_vendor("fake_method", symbol)
+    monkeypatch.setitem(interface.VENDOR_METHODS, "fake_method", {"local": found})
+    assert interface.route_to_vendor("fake_method", "AAPL") == "data for AAPL"
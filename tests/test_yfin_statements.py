@@ -0,0 +1,56 @@
+import pytest
+
+yfin_statements = pytest.importorskip("tradingagents.dataflows.yfin_statements")
+
+from tradingagents.dataflows import config as dataflow_config
+from tradingagents.dataflows.config import set_config
+
+
+class FlakyTicker:
+    """Ticker whose quarterly balance sheet fails until `healthy` is set."""
+
+    healthy = False
+    reads = []
+
+    def __init__(self, symbol):
+        pass
+
+    def __getattr__(self, attribute):
+        FlakyTicker.reads.append(attribute)
+        if attribute == "quarterly_balance_sheet" and not FlakyTicker.healthy:
+            raise ConnectionError("reset by peer")
+        return f"{attribute} data"
+
+
+@pytest.fixture
+def flaky(tmp_path, monkeypatch):
+    saved = dataflow_config._config.copy()
+    set_config({"data_cache_dir": str(tmp_path), "yfinance_statements_retry_seconds": 300})
+    monkeypatch.setattr(yfin_statements.yf, "Ticker", FlakyTicker, raising=False)
+    monkeypatch.setattr(yfin_statements, "_bundles", {})
+    FlakyTicker.healthy, FlakyTicker.reads = False, []
+    yield
+    dataflow_config._config = saved
+
+
+def test_statements_that_succeeded_are_cached_when_another_fails(flaky):
+    with pytest.raises(ConnectionError):
+        yfin_statements.get_statement("NVDA", "balance_sheet", "quarterly")
+    assert yfin_statements.get_statement("NVDA", "cashflow", "quarterly")[0] == "quarterly_cashflow data"
+
+    # Reopening from disk neither refetches the bundle nor retries early
+    yfin_statements._bundles.clear()
+    with pytest.raises(ConnectionError):
+        yfin_statements.get_statement("NVDA", "balance_sheet", "quarterly")
+    assert len(FlakyTicker.reads) == len(yfin_statements.STATEMENT_ATTRIBUTES)
+
+
+def test_failed_statements_are_retried_on_their_own(flaky):
+    yfin_statements.get_statement_bundle("NVDA")
+    FlakyTicker.healthy, FlakyTicker.reads = True, []
+    set_config({"yfinance_statements_retry_seconds": 0})
+
+    data, _ = yfin_statements.get_statement("NVDA", "balance_sheet", "quarterly")
+    assert data == "quarterly_balance_sheet data"
+    assert FlakyTicker.reads == ["quarterly_balance_sheet"]
+    assert yfin_statements.get_statement_bundle("NVDA")["failed"] == {}
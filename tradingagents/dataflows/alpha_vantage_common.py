@@ -1,9 +1,17 @@
 import os
+import time
+import threading
 import requests
 import pandas as pd
 import json
+from concurrent.futures import Future
 from datetime import datetime
 from io import StringIO
+from typing import Optional
+from requests.adapters import HTTPAdapter
+
+from .config import get_config
+from .vendor_cache import ErrorResult
 
 API_BASE_URL = "https://www.alphavantage.co/query"
 
@@ -39,8 +47,78 @@ class AlphaVantageRateLimitError(Exception):
     """Exception raised when Alpha Vantage API rate limit is exceeded."""
     pass
 
+class _TokenBucket:
+    """Process-wide token bucket pacing requests to a per-minute quota."""
+
+    def __init__(self, requests_per_minute: float, burst: int):
+        self.rate = requests_per_minute / 60.0
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a request may be sent."""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+_limiter = None
+_session = None
+_client_lock = threading.Lock()
+# Requests currently on the wire, keyed by their parameters
+_in_flight = {}
+
+
+def _get_rate_limiter() -> Optional[_TokenBucket]:
+    """The shared token bucket, or None when no per-minute quota is configured."""
+    global _limiter
+    config = get_config()
+    rate = config.get("alpha_vantage_requests_per_minute")
+    burst = config.get("alpha_vantage_burst", 1)
+    if rate is None:
+        return None
+    with _client_lock:
+        if _limiter is None or _limiter.rate != rate / 60.0 or _limiter.capacity != max(1, burst):
+            _limiter = _TokenBucket(rate, burst)
+        return _limiter
+
+
+def _get_session() -> requests.Session:
+    """Shared keep-alive session, so requests reuse pooled connections."""
+    global _session
+    with _client_lock:
+        if _session is None:
+            pool_size = get_config().get("vendor_max_workers", 8)
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+            _session = requests.Session()
+            _session.mount("https://", adapter)
+        return _session
+
+
+def _send_request(api_params: dict) -> str:
+    limiter = _get_rate_limiter()
+    if limiter is not None:
+        limiter.acquire()
+    timeout = get_config().get("http_timeout_seconds", 30)
+    response = _get_session().get(API_BASE_URL, params=api_params, timeout=timeout)
+    response.raise_for_status()
+    return response.text
+
+
 def _make_api_request(function_name: str, params: dict) -> dict | str:
     """Helper function to make API requests and handle responses.
+
+    Requests are paced by a process-wide token bucket, and concurrent identical
+    requests share a single HTTP call.
     
     Raises:
         AlphaVantageRateLimitError: When API rate limit is exceeded
@@ -63,10 +141,24 @@ def _make_api_request(function_name: str, params: dict) -> dict | str:
         # Remove entitlement if it's None or empty
         api_params.pop("entitlement", None)
     
-    response = requests.get(API_BASE_URL, params=api_params)
-    response.raise_for_status()
-
-    response_text = response.text
+    key = tuple(sorted(api_params.items()))
+    with _client_lock:
+        future = _in_flight.get(key)
+        leader = future is None
+        if leader:
+            future = Future()
+            _in_flight[key] = future
+
+    if leader:
+        try:
+            future.set_result(_send_request(api_params))
+        except BaseException as e:
+            future.set_exception(e)
+        finally:
+            with _client_lock:
+                del _in_flight[key]
+
+    response_text = future.result()
     
     # Check if response is JSON (error responses are typically JSON)
     try:
@@ -76,6 +168,9 @@ def _make_api_request(function_name: str, params: dict) -> dict | str:
             info_message = response_json["Information"]
             if "rate limit" in info_message.lower() or "api key" in info_message.lower():
                 raise AlphaVantageRateLimitError(f"Alpha Vantage rate limit exceeded: {info_message}")
+        # Invalid symbols and parameters come back as an error payload
+        if isinstance(response_json, dict) and "Error Message" in response_json:
+            return ErrorResult(response_text)
     except json.JSONDecodeError:
         # Response is not JSON (likely CSV data), which is normal
         pass
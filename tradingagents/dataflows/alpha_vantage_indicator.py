@@ -1,4 +1,37 @@
+import threading
+from collections import OrderedDict
+from datetime import date
+
 from .alpha_vantage_common import _make_api_request
+from .vendor_cache import ErrorResult
+
+# Raw indicator responses keyed by function, parameters and the day they were
+# fetched. One MACD or BBANDS response carries all three series of its family,
+# so e.g. macd, macds and macdh for a symbol are served by a single request.
+_SERIES_CACHE_SIZE = 128
+_series_cache = OrderedDict()
+_series_cache_lock = threading.Lock()
+
+
+def _fetch_indicator_series(function_name: str, params: dict) -> str:
+    """Fetch an indicator response once per day, serving repeats from memory."""
+    key = (function_name, tuple(sorted(params.items())), date.today().isoformat())
+    with _series_cache_lock:
+        if key in _series_cache:
+            _series_cache.move_to_end(key)
+            return _series_cache[key]
+
+    data = _make_api_request(function_name, params)
+
+    # JSON bodies are error messages; only keep actual CSV series
+    if not data.lstrip().startswith("{"):
+        with _series_cache_lock:
+            _series_cache[key] = data
+            _series_cache.move_to_end(key)
+            while len(_series_cache) > _SERIES_CACHE_SIZE:
+                _series_cache.popitem(last=False)
+    return data
+
 
 def get_indicator(
     symbol: str,
@@ -75,7 +108,7 @@ def get_indicator(
     try:
         # Get indicator data for the period
         if indicator == "close_50_sma":
-            data = _make_api_request("SMA", {
+            data = _fetch_indicator_series("SMA", {
                 "symbol": symbol,
                 "interval": interval,
                 "time_period": "50",
@@ -83,7 +116,7 @@ def get_indicator(
                 "datatype": "csv"
             })
         elif indicator == "close_200_sma":
-            data = _make_api_request("SMA", {
+            data = _fetch_indicator_series("SMA", {
                 "symbol": symbol,
                 "interval": interval,
                 "time_period": "200",
@@ -91,36 +124,22 @@ def get_indicator(
                 "datatype": "csv"
             })
         elif indicator == "close_10_ema":
-            data = _make_api_request("EMA", {
+            data = _fetch_indicator_series("EMA", {
                 "symbol": symbol,
                 "interval": interval,
                 "time_period": "10",
                 "series_type": series_type,
                 "datatype": "csv"
             })
-        elif indicator == "macd":
-            data = _make_api_request("MACD", {
-                "symbol": symbol,
-                "interval": interval,
-                "series_type": series_type,
-                "datatype": "csv"
-            })
-        elif indicator == "macds":
-            data = _make_api_request("MACD", {
-                "symbol": symbol,
-                "interval": interval,
-                "series_type": series_type,
-                "datatype": "csv"
-            })
-        elif indicator == "macdh":
-            data = _make_api_request("MACD", {
+        elif indicator in ["macd", "macds", "macdh"]:
+            data = _fetch_indicator_series("MACD", {
                 "symbol": symbol,
                 "interval": interval,
                 "series_type": series_type,
                 "datatype": "csv"
             })
         elif indicator == "rsi":
-            data = _make_api_request("RSI", {
+            data = _fetch_indicator_series("RSI", {
                 "symbol": symbol,
                 "interval": interval,
                 "time_period": str(time_period),
@@ -128,7 +147,7 @@ def get_indicator(
                 "datatype": "csv"
             })
         elif indicator in ["boll", "boll_ub", "boll_lb"]:
-            data = _make_api_request("BBANDS", {
+            data = _fetch_indicator_series("BBANDS", {
                 "symbol": symbol,
                 "interval": interval,
                 "time_period": "20",
@@ -136,7 +155,7 @@ def get_indicator(
                 "datatype": "csv"
             })
         elif indicator == "atr":
-            data = _make_api_request("ATR", {
+            data = _fetch_indicator_series("ATR", {
                 "symbol": symbol,
                 "interval": interval,
                 "time_period": str(time_period),
@@ -147,19 +166,19 @@ def get_indicator(
             # In a real implementation, this would need to be calculated from OHLCV data
             return f"## VWMA (Volume Weighted Moving Average) for {symbol}:\n\nVWMA calculation requires OHLCV data and is not directly available from Alpha Vantage API.\nThis indicator would need to be calculated from the raw stock data using volume-weighted price averaging.\n\n{indicator_descriptions.get('vwma', 'No description available.')}"
         else:
-            return f"Error: Indicator {indicator} not implemented yet."
+            return ErrorResult(f"Error: Indicator {indicator} not implemented yet.")
 
         # Parse CSV data and extract values for the date range
         lines = data.strip().split('\n')
         if len(lines) < 2:
-            return f"Error: No data returned for {indicator}"
+            return ErrorResult(f"Error: No data returned for {indicator}")
 
         # Parse header and data
         header = [col.strip() for col in lines[0].split(',')]
         try:
             date_col_idx = header.index('time')
         except ValueError:
-            return f"Error: 'time' column not found in data for {indicator}. Available columns: {header}"
+            return ErrorResult(f"Error: 'time' column not found in data for {indicator}. Available columns: {header}")
 
         # Map internal indicator names to expected CSV column names from Alpha Vantage
         col_name_map = {
@@ -178,7 +197,7 @@ def get_indicator(
             try:
                 value_col_idx = header.index(target_col_name)
             except ValueError:
-                return f"Error: Column '{target_col_name}' not found for indicator '{indicator}'. Available columns: {header}"
+                return ErrorResult(f"Error: Column '{target_col_name}' not found for indicator '{indicator}'. Available columns: {header}")
 
         result_data = []
         for line in lines[1:]:
@@ -219,4 +238,4 @@ def get_indicator(
 
     except Exception as e:
         print(f"Error getting Alpha Vantage indicator data for {indicator}: {e}")
-        return f"Error retrieving {indicator} data: {str(e)}"
+        return ErrorResult(f"Error retrieving {indicator} data: {str(e)}")
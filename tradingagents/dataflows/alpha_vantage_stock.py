@@ -1,5 +1,96 @@
-from datetime import datetime
+import os
+import threading
+from datetime import date
+from io import StringIO
+from typing import Optional, Tuple, Union
+
+import pandas as pd
+
 from .alpha_vantage_common import _make_api_request, _filter_csv_by_date_range
+from .config import get_config
+from .price_store import PriceStore, open_price_store, write_price_store
+from .vendor_cache import ErrorResult
+
+# Each symbol's full adjusted daily series is kept as a local price store and
+# topped up with compact (latest 100 days) requests, so date-range queries are
+# answered from disk. Adjusted closes are rewritten by the vendor whenever a
+# dividend or split happens, so those trigger a full refetch instead.
+_DATE_COLUMN = "timestamp"
+
+_symbol_locks = {}
+_symbol_locks_lock = threading.Lock()
+
+
+def _get_symbol_lock(symbol: str) -> threading.Lock:
+    with _symbol_locks_lock:
+        return _symbol_locks.setdefault(symbol, threading.Lock())
+
+
+def get_daily_series_path(symbol: str) -> str:
+    return os.path.join(get_config()["data_cache_dir"], "alpha_vantage", "daily_adjusted", symbol.upper())
+
+
+def _fetch_daily_series(symbol: str, outputsize: str) -> Tuple[str, Optional[pd.DataFrame]]:
+    """Request the daily adjusted series.
+
+    Returns:
+        (response, data): the raw response, and its rows or None if it is not a CSV series
+    """
+    response = _make_api_request("TIME_SERIES_DAILY_ADJUSTED", {
+        "symbol": symbol,
+        "outputsize": outputsize,
+        "datatype": "csv",
+    })
+    try:
+        data = pd.read_csv(StringIO(response))
+    except Exception:
+        return response, None
+    if _DATE_COLUMN not in data.columns or data.empty:
+        return response, None
+    return response, data
+
+
+def _has_corporate_actions(data: pd.DataFrame) -> bool:
+    dividends = data["dividend_amount"] if "dividend_amount" in data else pd.Series(dtype=float)
+    splits = data["split_coefficient"] if "split_coefficient" in data else pd.Series(dtype=float)
+    return bool((dividends.fillna(0) != 0).any() or (splits.fillna(1) != 1).any())
+
+
+def _load_daily_series(symbol: str, end_date: str) -> Union[PriceStore, str]:
+    """Return the local daily series for symbol, refreshing it if it does not reach end_date.
+
+    If the vendor does not return a series, its raw response is returned instead.
+    """
+    path = get_daily_series_path(symbol)
+    today = date.today().isoformat()
+
+    with _get_symbol_lock(symbol.upper()):
+        store = open_price_store(path)
+        if store is not None and (
+            end_date <= store.last_date or store.meta.get("refreshed_on") == today
+        ):
+            return store
+
+        data = None
+        if store is not None:
+            response, recent = _fetch_daily_series(symbol, "compact")
+            if recent is None:
+                return response
+            recent_dates = recent[_DATE_COLUMN].astype(str).str[:10]
+            new_rows = recent[recent_dates > store.last_date]
+            # Append only when the compact window overlaps what we have and no
+            # dividend or split invalidated the stored adjusted closes
+            if recent_dates.min() <= store.last_date and not _has_corporate_actions(new_rows):
+                data = pd.concat([store.slice(), new_rows], ignore_index=True)
+
+        if data is None:
+            response, data = _fetch_daily_series(symbol, "full")
+            if data is None:
+                return response
+
+        write_price_store(path, data, date_column=_DATE_COLUMN, extra_meta={"refreshed_on": today})
+        return open_price_store(path)
+
 
 def get_stock(
     symbol: str,
@@ -18,21 +109,9 @@ def get_stock(
     Returns:
         CSV string containing the daily adjusted time series data filtered to the date range.
     """
-    # Parse dates to determine the range
-    start_dt = datetime.strptime(start_date, "%Y-%m-%d")
-    today = datetime.now()
-
-    # Choose outputsize based on whether the requested range is within the latest 100 days
-    # Compact returns latest 100 data points, so check if start_date is recent enough
-    days_from_today_to_start = (today - start_dt).days
-    outputsize = "compact" if days_from_today_to_start < 100 else "full"
-
-    params = {
-        "symbol": symbol,
-        "outputsize": outputsize,
-        "datatype": "csv",
-    }
-
-    response = _make_api_request("TIME_SERIES_DAILY_ADJUSTED", params)
+    store = _load_daily_series(symbol, end_date)
+    if isinstance(store, str):
+        return ErrorResult(_filter_csv_by_date_range(store, start_date, end_date))
 
-    return _filter_csv_by_date_range(response, start_date, end_date)
\ No newline at end of file
+    # Alpha Vantage lists the newest day first
+    return store.slice(start_date, end_date).iloc[::-1].to_csv(index=False)
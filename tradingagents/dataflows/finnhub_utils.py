@@ -0,0 +1,107 @@
+import os
+import glob
+import json
+import pickle
+import threading
+from bisect import bisect_left, bisect_right
+from typing import Annotated, Dict, List
+
+# Parsed Finnhub files are kept in process, keyed by path and invalidated when
+# the file on disk changes. A pickled copy next to the JSON (see
+# build_finnhub_cache) is preferred when present since it loads much faster.
+_datasets: Dict[str, "FinnhubDataset"] = {}
+_datasets_lock = threading.Lock()
+
+
+class FinnhubDataset:
+    """A {YYYY-MM-DD: [entries]} Finnhub file with a sorted date index."""
+
+    def __init__(self, data: dict, mtime: float):
+        self.data = data
+        self.mtime = mtime
+        # Remember the file order so range results come back in that order
+        self.order = {key: i for i, key in enumerate(data)}
+        self.sorted_keys = sorted(data)
+
+    def range(
+        self,
+        start_date: Annotated[str, "Start date in YYYY-MM-DD format"],
+        end_date: Annotated[str, "End date in YYYY-MM-DD format"],
+    ) -> dict:
+        """Return the non-empty entries whose date key lies in [start_date, end_date]."""
+        lo = bisect_left(self.sorted_keys, start_date)
+        hi = bisect_right(self.sorted_keys, end_date)
+        keys = sorted(self.sorted_keys[lo:hi], key=self.order.__getitem__)
+        return {key: self.data[key] for key in keys if len(self.data[key]) > 0}
+
+
+def _cache_path(json_path: str) -> str:
+    return os.path.splitext(json_path)[0] + ".pkl"
+
+
+def load_finnhub_data(
+    json_path: Annotated[str, "Path of a {ticker}_data_formatted.json file"],
+) -> FinnhubDataset:
+    """Load a Finnhub file once per process, from its binary cache when up to date."""
+    mtime = os.path.getmtime(json_path)
+
+    with _datasets_lock:
+        dataset = _datasets.get(json_path)
+        if dataset is not None and dataset.mtime == mtime:
+            return dataset
+
+    cache_path = _cache_path(json_path)
+    if os.path.exists(cache_path) and os.path.getmtime(cache_path) >= mtime:
+        with open(cache_path, "rb") as f:
+            data = pickle.load(f)
+    else:
+        with open(json_path, "r") as f:
+            data = json.load(f)
+
+    dataset = FinnhubDataset(data, mtime)
+    with _datasets_lock:
+        _datasets[json_path] = dataset
+    return dataset
+
+
+def build_finnhub_cache(
+    data_dir: Annotated[str, "Directory where the finnhub_data folder is saved"],
+) -> List[str]:
+    """Write a pickled copy next to every Finnhub JSON file under data_dir/finnhub_data.
+
+    Returns:
+        list: the JSON files that were converted
+    """
+    converted = []
+    pattern = os.path.join(data_dir, "finnhub_data", "*", "*_data_formatted.json")
+    for json_path in sorted(glob.glob(pattern)):
+        with open(json_path, "r") as f:
+            data = json.load(f)
+        tmp_path = _cache_path(json_path) + ".tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, _cache_path(json_path))
+        converted.append(json_path)
+    return converted
+
+
+def unique_entries(
+    data: Annotated[dict, "{date: [entries]} as returned by FinnhubDataset.range"],
+) -> List[dict]:
+    """Flatten the entries of data in order, dropping exact duplicates."""
+    seen = set()
+    entries = []
+    for entry_list in data.values():
+        for entry in entry_list:
+            key = json.dumps(entry, sort_keys=True, default=str)
+            if key not in seen:
+                seen.add(key)
+                entries.append(entry)
+    return entries
+
+
+if __name__ == "__main__":
+    from .config import DATA_DIR
+
+    files = build_finnhub_cache(DATA_DIR)
+    print(f"Cached {len(files)} Finnhub files")
@@ -1,7 +1,7 @@
 from typing import Annotated
 from datetime import datetime
 from dateutil.relativedelta import relativedelta
-from .googlenews_utils import getNewsData
+from .googlenews_utils import getNewsDataConcurrent
 
 
 def get_google_news(
@@ -15,7 +15,7 @@ def get_google_news(
     before = start_date - relativedelta(days=look_back_days)
     before = before.strftime("%Y-%m-%d")
 
-    news_results = getNewsData(query, before, curr_date)
+    news_results = getNewsDataConcurrent(query, before, curr_date)
 
     news_str = ""
 
@@ -1,7 +1,11 @@
+import os
 import json
+import asyncio
+import hashlib
+import threading
 import requests
 from bs4 import BeautifulSoup
-from datetime import datetime
+from datetime import datetime, timedelta
 import time
 import random
 from tenacity import (
@@ -12,6 +16,21 @@ from tenacity import (
     retry_if_result,
 )
 
+from .config import get_config
+
+HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/101.0.4951.54 Safari/537.36"
+    )
+}
+
+# Earliest start time of the next request, shared by every concurrent scrape in
+# the process so the politeness delay holds across event loops and threads
+_next_request_at = 0.0
+_pace_lock = threading.Lock()
+
 
 def is_rate_limited(response):
     """Check if the response indicates rate limiting (status code 429)"""
@@ -27,10 +46,58 @@ def make_request(url, headers):
     """Make a request with retry logic for rate limiting"""
     # Random delay before each request to avoid detection
     time.sleep(random.uniform(2, 6))
-    response = requests.get(url, headers=headers)
+    response = requests.get(url, headers=headers, timeout=get_config().get("http_timeout_seconds", 30))
     return response
 
 
+def _to_search_date(date_str):
+    """Convert yyyy-mm-dd to the mm/dd/yyyy format used by the search URL."""
+    if "-" in date_str:
+        date_str = datetime.strptime(date_str, "%Y-%m-%d").strftime("%m/%d/%Y")
+    return date_str
+
+
+def _search_url(query, start_date, end_date, page):
+    offset = page * 10
+    return (
+        f"https://www.google.com/search?q={query}"
+        f"&tbs=cdr:1,cd_min:{start_date},cd_max:{end_date}"
+        f"&tbm=nws&start={offset}"
+    )
+
+
+def _parse_page(content):
+    """Extract the news results from one results page.
+
+    Returns:
+        (results, has_next): the parsed results, and whether a next page exists
+    """
+    soup = BeautifulSoup(content, "html.parser")
+    news_results = []
+    for el in soup.select("div.SoaBEf"):
+        try:
+            link = el.find("a")["href"]
+            title = el.select_one("div.MBeuO").get_text()
+            snippet = el.select_one(".GI74Re").get_text()
+            date = el.select_one(".LfVVr").get_text()
+            source = el.select_one(".NUnG9d span").get_text()
+            news_results.append(
+                {
+                    "link": link,
+                    "title": title,
+                    "snippet": snippet,
+                    "date": date,
+                    "source": source,
+                }
+            )
+        except Exception as e:
+            print(f"Error processing result: {e}")
+            # If one of the fields is not found, skip this result
+            continue
+
+    return news_results, soup.find("a", id="pnnext") is not None
+
+
 def getNewsData(query, start_date, end_date):
     """
     Scrape Google News search results for a given query and date range.
@@ -38,65 +105,22 @@ def getNewsData(query, start_date, end_date):
     start_date: str - start date in the format yyyy-mm-dd or mm/dd/yyyy
     end_date: str - end date in the format yyyy-mm-dd or mm/dd/yyyy
     """
-    if "-" in start_date:
-        start_date = datetime.strptime(start_date, "%Y-%m-%d")
-        start_date = start_date.strftime("%m/%d/%Y")
-    if "-" in end_date:
-        end_date = datetime.strptime(end_date, "%Y-%m-%d")
-        end_date = end_date.strftime("%m/%d/%Y")
-
-    headers = {
-        "User-Agent": (
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/101.0.4951.54 Safari/537.36"
-        )
-    }
+    start_date, end_date = _to_search_date(start_date), _to_search_date(end_date)
 
     news_results = []
     page = 0
     while True:
-        offset = page * 10
-        url = (
-            f"https://www.google.com/search?q={query}"
-            f"&tbs=cdr:1,cd_min:{start_date},cd_max:{end_date}"
-            f"&tbm=nws&start={offset}"
-        )
-
         try:
-            response = make_request(url, headers)
-            soup = BeautifulSoup(response.content, "html.parser")
-            results_on_page = soup.select("div.SoaBEf")
+            response = make_request(_search_url(query, start_date, end_date, page), HEADERS)
+            results_on_page, has_next = _parse_page(response.content)
 
             if not results_on_page:
                 break  # No more results found
 
-            for el in results_on_page:
-                try:
-                    link = el.find("a")["href"]
-                    title = el.select_one("div.MBeuO").get_text()
-                    snippet = el.select_one(".GI74Re").get_text()
-                    date = el.select_one(".LfVVr").get_text()
-                    source = el.select_one(".NUnG9d span").get_text()
-                    news_results.append(
-                        {
-                            "link": link,
-                            "title": title,
-                            "snippet": snippet,
-                            "date": date,
-                            "source": source,
-                        }
-                    )
-                except Exception as e:
-                    print(f"Error processing result: {e}")
-                    # If one of the fields is not found, skip this result
-                    continue
-
-            # Update the progress bar with the current count of results scraped
+            news_results.extend(results_on_page)
 
             # Check for the "Next" link (pagination)
-            next_link = soup.find("a", id="pnnext")
-            if not next_link:
+            if not has_next:
                 break
 
             page += 1
@@ -106,3 +130,146 @@ def getNewsData(query, start_date, end_date):
             break
 
     return news_results
+
+
+async def _polite_delay(min_delay: float, max_delay: float) -> None:
+    """Wait for this request's slot, keeping a random gap between request starts."""
+    global _next_request_at
+    with _pace_lock:
+        now = time.monotonic()
+        start = max(now, _next_request_at)
+        _next_request_at = start + random.uniform(min_delay, max_delay)
+    await asyncio.sleep(start - now)
+
+
+async def _afetch_page(url, semaphore, settings):
+    """Fetch and parse one results page, backing off while rate limited."""
+    async with semaphore:
+        for attempt in range(5):
+            await _polite_delay(settings.get("min_delay", 1.0), settings.get("max_delay", 3.0))
+            response = await asyncio.to_thread(
+                requests.get, url, headers=HEADERS, timeout=get_config().get("http_timeout_seconds", 30)
+            )
+            if not is_rate_limited(response):
+                break
+            await asyncio.sleep(min(60, 4 * 2 ** attempt))
+        else:
+            raise RuntimeError(f"Rate limited after 5 attempts: {url}")
+    return await asyncio.to_thread(_parse_page, response.content)
+
+
+def _cache_path(query, start_date, end_date, max_pages) -> str:
+    key = json.dumps([query, start_date, end_date, max_pages])
+    digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+    return os.path.join(get_config()["data_cache_dir"], "google_news", f"{digest}.json")
+
+
+def _read_cache(path, ttl):
+    try:
+        with open(path, "r") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if cached["historical"] or time.time() - cached["fetched_at"] < ttl:
+        return cached["results"]
+    return None
+
+
+def _write_cache(path, results, historical):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp-{os.getpid()}-{threading.get_ident()}"
+    with open(tmp_path, "w") as f:
+        json.dump({"fetched_at": time.time(), "historical": historical, "results": results}, f)
+    os.replace(tmp_path, path)
+
+
+async def agetNewsData(query, start_date, end_date):
+    """
+    Async variant of getNewsData that fetches result pages concurrently.
+    Page 0 is fetched on its own, as most searches fit on one page; only once
+    it links to a next page are the following pages requested in waves of up
+    to max_concurrency, spaced by the configured politeness delay, and parsed
+    off the event loop. Results are cached per (query, date range); windows
+    that ended before yesterday are kept for good, others for cache_ttl_seconds.
+    query: str - search query
+    start_date: str - start date in the format yyyy-mm-dd or mm/dd/yyyy
+    end_date: str - end date in the format yyyy-mm-dd or mm/dd/yyyy
+    """
+    start_date, end_date = _to_search_date(start_date), _to_search_date(end_date)
+    settings = get_config().get("google_news", {})
+    max_pages = settings.get("max_pages")
+
+    cache_path = _cache_path(query, start_date, end_date, max_pages)
+    cached = _read_cache(cache_path, settings.get("cache_ttl_seconds", 3600))
+    if cached is not None:
+        return cached
+
+    concurrency = max(1, settings.get("max_concurrency", 3))
+    semaphore = asyncio.Semaphore(concurrency)
+
+    news_results = []
+    complete = True
+    page = 0
+    width = 1
+    done = False
+    while not done:
+        wave = range(page, page + width)
+        if max_pages is not None:
+            wave = range(page, min(page + width, max_pages))
+        if not wave:
+            break
+
+        outcomes = await asyncio.gather(
+            *[
+                _afetch_page(_search_url(query, start_date, end_date, p), semaphore, settings)
+                for p in wave
+            ],
+            return_exceptions=True,
+        )
+
+        # Keep pages in order up to the first one that ends the results
+        for outcome in outcomes:
+            if isinstance(outcome, Exception):
+                print(f"Failed after multiple retries: {outcome}")
+                complete = False
+                done = True
+                break
+            results_on_page, has_next = outcome
+            news_results.extend(results_on_page)
+            if not results_on_page or not has_next:
+                done = True
+                break
+        page += len(wave)
+        width = concurrency
+
+    if complete:
+        end_dt = datetime.strptime(end_date, "%m/%d/%Y").date()
+        historical = end_dt < datetime.now().date() - timedelta(days=1)
+        _write_cache(cache_path, news_results, historical)
+
+    return news_results
+
+
+def getNewsDataConcurrent(query, start_date, end_date):
+    """Blocking wrapper around agetNewsData, usable with or without a running event loop."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(agetNewsData(query, start_date, end_date))
+
+    # Already inside an event loop: run the scrape on its own loop in a worker
+    # thread, handing its result or exception back to the caller
+    result = {}
+
+    def runner():
+        try:
+            result["value"] = asyncio.run(agetNewsData(query, start_date, end_date))
+        except BaseException as e:
+            result["error"] = e
+
+    thread = threading.Thread(target=runner)
+    thread.start()
+    thread.join()
+    if "error" in result:
+        raise result["error"]
+    return result["value"]
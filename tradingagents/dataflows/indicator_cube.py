@@ -0,0 +1,173 @@
+import os
+import sys
+import json
+import shutil
+import threading
+from datetime import datetime
+from typing import Annotated, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from .config import get_config
+from .stockstats_utils import StockstatsUtils
+
+# The cube is a dense float32 array of shape (ticker, date, indicator) over the
+# union of the tickers' trading days, plus a (ticker, date) mask of the days on
+# which each ticker actually traded. Both are memory-mapped when opened.
+_VALUES_FILE = "values.npy"
+_VALID_FILE = "valid.npy"
+_DATES_FILE = "dates.npy"
+_META_FILE = "meta.json"
+
+_open_cube = None
+_open_cube_lock = threading.Lock()
+
+
+def get_indicator_cube_dir() -> str:
+    return os.path.join(get_config()["data_cache_dir"], "indicator_cube")
+
+
+def _indicator_source() -> str:
+    """Which price history the stockstats vendor currently reads from."""
+    config = get_config()
+    return "local" if config["data_vendors"]["technical_indicators"] == "local" else "online"
+
+
+class IndicatorCube:
+    """Read-only view over a precomputed (ticker x date x indicator) cube."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.mtime = os.path.getmtime(os.path.join(path, _META_FILE))
+        with open(os.path.join(path, _META_FILE), "r") as f:
+            self.meta = json.load(f)
+        self.source = self.meta["source"]
+        self.ticker_index = {t: i for i, t in enumerate(self.meta["tickers"])}
+        self.indicator_index = {ind: i for i, ind in enumerate(self.meta["indicators"])}
+        self.last_dates = self.meta["last_dates"]
+        self.dates = np.load(os.path.join(path, _DATES_FILE), mmap_mode="r")
+        self.values = np.load(os.path.join(path, _VALUES_FILE), mmap_mode="r")
+        self.valid = np.load(os.path.join(path, _VALID_FILE), mmap_mode="r")
+
+    def lookup(
+        self,
+        symbol: Annotated[str, "ticker symbol of the company"],
+        indicator: Annotated[str, "technical indicator name"],
+        start_date: Annotated[str, "start date of the window, YYYY-mm-dd"],
+        end_date: Annotated[str, "end date of the window, YYYY-mm-dd"],
+    ) -> Optional[pd.Series]:
+        """Return the indicator values for the trading days in the window.
+
+        Returns None when the cube cannot answer the query (unknown ticker or
+        indicator, different price source, or a window past the cube's data),
+        in which case the caller should compute the indicator itself.
+        """
+        t = self.ticker_index.get(symbol.upper())
+        i = self.indicator_index.get(indicator)
+        if t is None or i is None or self.source != _indicator_source():
+            return None
+        if end_date > self.last_dates[t]:
+            return None
+
+        lo = int(np.searchsorted(self.dates, np.datetime64(start_date, "D"), side="left"))
+        hi = int(np.searchsorted(self.dates, np.datetime64(end_date, "D"), side="right"))
+        traded = np.asarray(self.valid[t, lo:hi])
+        dates = pd.DatetimeIndex(np.asarray(self.dates[lo:hi])[traded]).strftime("%Y-%m-%d")
+        values = np.asarray(self.values[t, lo:hi, i])[traded]
+        return pd.Series(values, index=dates, name=indicator)
+
+
+def open_indicator_cube(
+    cube_dir: Annotated[Optional[str], "Directory of the cube, defaults to data_cache_dir/indicator_cube"] = None,
+) -> Optional[IndicatorCube]:
+    """Open the cube (once per process), or return None if it has not been built."""
+    global _open_cube
+    path = os.path.abspath(cube_dir or get_indicator_cube_dir())
+    try:
+        mtime = os.path.getmtime(os.path.join(path, _META_FILE))
+    except OSError:
+        return None
+
+    with _open_cube_lock:
+        if _open_cube is None or _open_cube.path != path or _open_cube.mtime != mtime:
+            _open_cube = IndicatorCube(path)
+        return _open_cube
+
+
+def build_indicator_cube(
+    tickers: Annotated[List[str], "ticker universe to precompute"],
+    indicators: Annotated[Optional[List[str]], "indicators to precompute, defaults to all supported"] = None,
+    cube_dir: Annotated[Optional[str], "Output directory, defaults to data_cache_dir/indicator_cube"] = None,
+) -> str:
+    """Precompute every indicator for every ticker over its full history.
+
+    Price history is loaded through StockstatsUtils, so the cube is built from
+    the same source (local data or the yfinance cache) that the technical
+    indicators vendor is configured to use. Frames bypass the per-symbol memo
+    so building a large universe does not keep every history in memory.
+
+    Returns:
+        str: the directory the cube was written to
+    """
+    from .y_finance import BEST_IND_PARAMS
+
+    indicators = list(indicators or BEST_IND_PARAMS.keys())
+    cube_dir = os.path.abspath(cube_dir or get_indicator_cube_dir())
+
+    frames = {}
+    for ticker in tickers:
+        ticker = ticker.upper()
+        try:
+            df = StockstatsUtils.get_stock_data(ticker, memoize=False)
+            frames[ticker] = (
+                df["Date"].values.astype("datetime64[D]"),
+                np.column_stack(
+                    [df[indicator].values.astype(np.float32) for indicator in indicators]
+                ),
+            )
+        except Exception as e:
+            print(f"Skipping {ticker} in indicator cube: {e}")
+
+    if not frames:
+        raise ValueError("Indicator cube build failed: no ticker could be loaded")
+
+    symbols = list(frames.keys())
+    dates = np.unique(np.concatenate([frames[t][0] for t in symbols]))
+
+    values = np.full((len(symbols), len(dates), len(indicators)), np.nan, dtype=np.float32)
+    valid = np.zeros((len(symbols), len(dates)), dtype=bool)
+    last_dates = []
+    for t, ticker in enumerate(symbols):
+        ticker_dates, ticker_values = frames[ticker]
+        positions = np.searchsorted(dates, ticker_dates)
+        values[t, positions, :] = ticker_values
+        valid[t, positions] = True
+        last_dates.append(str(ticker_dates.max()))
+
+    tmp_dir = f"{cube_dir}.tmp-{os.getpid()}"
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    os.makedirs(tmp_dir)
+    np.save(os.path.join(tmp_dir, _DATES_FILE), dates)
+    np.save(os.path.join(tmp_dir, _VALUES_FILE), values)
+    np.save(os.path.join(tmp_dir, _VALID_FILE), valid)
+    with open(os.path.join(tmp_dir, _META_FILE), "w") as f:
+        json.dump(
+            {
+                "tickers": symbols,
+                "indicators": indicators,
+                "last_dates": last_dates,
+                "source": _indicator_source(),
+                "built_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            },
+            f,
+        )
+
+    shutil.rmtree(cube_dir, ignore_errors=True)
+    os.replace(tmp_dir, cube_dir)
+    return cube_dir
+
+
+if __name__ == "__main__":
+    path = build_indicator_cube(sys.argv[1:])
+    print(f"Indicator cube written to {path}")
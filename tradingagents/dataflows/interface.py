@@ -1,4 +1,9 @@
 from typing import Annotated
+import time
+import weakref
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait, TimeoutError as FuturesTimeoutError
 
 # Import from vendor-specific modules
 from .local import get_YFin_data, get_finnhub_news, get_finnhub_company_insider_sentiment, get_finnhub_company_insider_transactions, get_simfin_balance_sheet, get_simfin_cashflow, get_simfin_income_statements, get_reddit_global_news, get_reddit_company_news
@@ -16,10 +21,16 @@ from .alpha_vantage import (
     get_news as get_alpha_vantage_news
 )
 from .alpha_vantage_common import AlphaVantageRateLimitError
+from .rendering import render_tool_results
+from .vendor_health import allow_call, record_call, order_by_latency, latency_percentile, is_transient_error
+from . import vendor_metrics
+from .vendor_cache import ErrorResult, get_vendor_cache, is_historical_call
 
 # Configuration and routing logic
 from .config import get_config
 
+logger = logging.getLogger(__name__)
+
 # Tools organized by category
 TOOLS_CATEGORIES = {
     "core_stock_apis": {
@@ -116,6 +127,13 @@ VENDOR_METHODS = {
     },
 }
 
+# Upstream service of implementations shared between vendors. Concurrency
+# limits apply per service, so e.g. the Google News scraper is held to the
+# "google" limit whether it is routed as "google" or as part of "local".
+IMPL_SERVICES = {
+    get_google_news: "google",
+}
+
 def get_category_for_method(method: str) -> str:
     """Get the category that contains the specified method."""
     for category, info in TOOLS_CATEGORIES.items():
@@ -138,6 +156,306 @@ def get_vendor(category: str, method: str = None) -> str:
     # Fall back to category-level configuration
     return config.get("data_vendors", {}).get(category, "default")
 
+# Shared pool for concurrent vendor calls, and per-service limits on in-flight calls
+_executor = None
+_executor_lock = threading.Lock()
+_service_semaphores = {}
+# Pool each submitted call runs on, so an abandoned call can retire it
+_future_pools = weakref.WeakKeyDictionary()
+# When each submitted call got its service slot, so deadlines exclude queueing
+_call_starts = weakref.WeakKeyDictionary()
+# How often hedged routing checks whether queued calls have started
+_QUEUE_POLL_SECONDS = 0.05
+
+
+class _CallStart:
+    """Marks when a submitted call entered its service semaphore.
+
+    The event is also set if the call finishes without getting that far, with
+    `at` left as None.
+    """
+
+    def __init__(self):
+        self.at = None
+        self.event = threading.Event()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=get_config().get("vendor_max_workers", 8),
+                thread_name_prefix="vendor",
+            )
+        return _executor
+
+
+def _submit_call(impl_func, vendor: str, args, kwargs):
+    """Run one implementation on the shared pool, tracking when it actually starts."""
+    executor = _get_executor()
+    start = _CallStart()
+    future = executor.submit(_call_vendor_impl, impl_func, vendor, args, kwargs, start)
+    with _executor_lock:
+        _future_pools[future] = executor
+        _call_starts[future] = start
+    return future
+
+
+def _started_at(future):
+    """When a submitted call got its service slot, or None if it is still queued."""
+    return _call_starts[future].at
+
+
+def _abandon(futures) -> None:
+    """Stop waiting on calls whose results will be ignored.
+
+    A running call cannot be interrupted: it keeps its pool worker and its
+    vendor's concurrency slot until the vendor answers or the HTTP timeout
+    fires. The pool holding it is retired so later calls, fallbacks included,
+    get fresh workers instead of queueing behind it; the vendor's slot stays
+    taken, since its request is still in flight upstream.
+    """
+    global _executor
+    for future in futures:
+        if future.done():
+            continue
+        with _executor_lock:
+            executor = _future_pools.get(future)
+            if executor is None or executor is not _executor:
+                continue
+            _executor = None
+        executor.shutdown(wait=False)
+
+
+def _get_service(impl_func, vendor: str) -> str:
+    """Upstream service an implementation calls; the vendor name unless listed in IMPL_SERVICES."""
+    return IMPL_SERVICES.get(impl_func, vendor)
+
+
+def _get_service_semaphore(service: str) -> threading.BoundedSemaphore:
+    limits = get_config().get("vendor_concurrency_limits", {})
+    limit = limits.get(service, limits.get("default", 4))
+    with _executor_lock:
+        entry = _service_semaphores.get(service)
+        if entry is None or entry[0] != limit:
+            entry = (limit, threading.BoundedSemaphore(limit))
+            _service_semaphores[service] = entry
+        return entry[1]
+
+
+def _call_vendor_impl(impl_func, vendor_name: str, args, kwargs, start=None):
+    """Call one vendor implementation.
+
+    Elapsed time, and the deadline of a submitted call, run from when the call
+    gets its service slot. Returns (succeeded, result, elapsed seconds); on
+    failure the result is the exception.
+    """
+    started = None
+    try:
+        logger.debug("Calling %s from vendor '%s'", impl_func.__name__, vendor_name)
+        with _get_service_semaphore(_get_service(impl_func, vendor_name)):
+            started = time.perf_counter()
+            if start is not None:
+                start.at = started
+                start.event.set()
+            result = impl_func(*args, **kwargs)
+        elapsed = time.perf_counter() - started
+        logger.debug("%s from vendor '%s' completed in %.3fs", impl_func.__name__, vendor_name, elapsed)
+        return True, result, elapsed
+
+    except AlphaVantageRateLimitError as e:
+        if vendor_name == "alpha_vantage":
+            logger.warning("Alpha Vantage rate limit exceeded, falling back to next available vendor: %s", e)
+        # Continue to next vendor for fallback
+        return False, e, _elapsed_since(started)
+    except Exception as e:
+        # Log error but continue with other implementations
+        logger.warning("%s from vendor '%s' failed: %s", impl_func.__name__, vendor_name, e)
+        return False, e, _elapsed_since(started)
+    finally:
+        if start is not None:
+            start.event.set()
+
+
+def _record_attempt(method: str, vendor: str, latency: float, outcomes: list) -> None:
+    """Feed one vendor attempt to the circuit breaker and the metrics registry."""
+    succeeded = any(ok for ok, _, _ in outcomes)
+    transient = not succeeded and any(
+        is_transient_error(error) for ok, error, _ in outcomes if not ok
+    )
+    record_call(method, vendor, latency, succeeded, transient)
+    vendor_metrics.record_attempt(method, vendor, latency, succeeded)
+
+
+def _elapsed_since(started) -> float:
+    return time.perf_counter() - started if started is not None else 0.0
+
+
+def _get_vendor_impls(method: str, vendor: str) -> list:
+    vendor_impl = VENDOR_METHODS[method][vendor]
+    return vendor_impl if isinstance(vendor_impl, list) else [vendor_impl]
+
+
+def _submit_vendor_impls(method: str, vendor: str, args, kwargs) -> list:
+    return [
+        _submit_call(impl_func, vendor, args, kwargs)
+        for impl_func in _get_vendor_impls(method, vendor)
+    ]
+
+
+def _get_deadline(method: str):
+    """Seconds a single vendor attempt for method may take, or None for no limit."""
+    deadlines = get_config().get("vendor_deadlines", {})
+    return deadlines.get(method, deadlines.get("default")) or None
+
+
+def _await_outcome(future, method: str, vendor: str, deadline):
+    """Wait for one implementation until its deadline; a late call is ignored.
+
+    The deadline runs from when the call got its pool worker and service slot,
+    so waiting behind other calls never counts as a vendor timeout.
+    """
+    remaining = None
+    if deadline is not None:
+        _call_starts[future].event.wait()
+        started = _started_at(future)
+        if started is not None:
+            remaining = max(0.0, started + deadline - time.perf_counter())
+    try:
+        return future.result(timeout=remaining)
+    except FuturesTimeoutError:
+        logger.warning("Vendor '%s' did not answer within %ss, falling back to next vendor", vendor, deadline)
+        vendor_metrics.increment(method, vendor, "timeouts")
+        _abandon([future])
+        return False, FuturesTimeoutError(), time.perf_counter() - started
+
+
+def _run_vendor(method: str, vendor: str, args, kwargs, concurrent: bool, futures=None, deadline=None):
+    """Run a vendor's implementations, keeping outcomes in implementation order."""
+    if futures is None and concurrent:
+        futures = _submit_vendor_impls(method, vendor, args, kwargs)
+    if futures is not None:
+        return [_await_outcome(future, method, vendor, deadline) for future in futures]
+    if deadline is None:
+        return [
+            _call_vendor_impl(impl_func, vendor, args, kwargs)
+            for impl_func in _get_vendor_impls(method, vendor)
+        ]
+    # Run one at a time on the pool so a hung call can be abandoned at the deadline
+    return [
+        _await_outcome(_submit_call(impl_func, vendor, args, kwargs), method, vendor, deadline)
+        for impl_func in _get_vendor_impls(method, vendor)
+    ]
+
+
+def _vendor_started_at(futures):
+    """When the first of a vendor's calls got its service slot, or None if all are queued."""
+    starts = [_started_at(future) for future in futures]
+    starts = [at for at in starts if at is not None]
+    return min(starts) if starts else None
+
+
+def _hedge_delay(method: str, vendor: str):
+    """How long to wait on vendor before also starting the next one: its p95 latency."""
+    settings = get_config().get("vendor_hedging", {})
+    p95 = latency_percentile(method, vendor, 95, settings.get("min_samples", 5))
+    if p95 is None:
+        return None
+    return max(settings.get("min_delay", 0.5), p95)
+
+
+def _route_hedged(method: str, vendors: list, args, kwargs, deadline):
+    """Try vendors in order, starting the next one early when the current one is slow.
+
+    A vendor that has not answered by its p95 latency gets the next vendor
+    started alongside it; the first one to succeed wins and the others are
+    ignored. A vendor's deadline runs from when its first call got a service
+    slot. Returns (vendor, results, attempts), with vendor None if all failed.
+    """
+    remaining = list(vendors)
+    running = []
+    attempts = 0
+
+    def launch():
+        """Start the next vendor whose circuit lets a call through, if any."""
+        nonlocal attempts
+        while remaining:
+            vendor = remaining.pop(0)
+            if allow_call(method, vendor):
+                break
+            logger.info("Circuit open for vendor '%s' on %s, falling back to next vendor", vendor, method)
+        else:
+            return
+        attempts += 1
+        logger.debug("Attempting vendor '%s' for %s (attempt #%d)", vendor, method, attempts)
+        if attempts > 1:
+            vendor_metrics.increment(method, vendor, "fallbacks")
+        running.append((vendor, _submit_vendor_impls(method, vendor, args, kwargs), time.perf_counter()))
+
+    if remaining:
+        launch()
+    while running:
+        newest_vendor, _, newest_started = running[-1]
+        hedge_after = _hedge_delay(method, newest_vendor) if remaining else None
+
+        now = time.perf_counter()
+        timeouts = []
+        if hedge_after is not None:
+            timeouts.append(newest_started + hedge_after - now)
+        if deadline is not None:
+            for _, futures, _ in running:
+                started_at = _vendor_started_at(futures)
+                if started_at is not None:
+                    timeouts.append(started_at + deadline - now)
+                elif not all(future.done() for future in futures):
+                    # The deadline only begins once a queued call starts
+                    timeouts.append(_QUEUE_POLL_SECONDS)
+        waiting = [f for _, futures, _ in running for f in futures if not f.done()]
+        if waiting:
+            wait(waiting, timeout=max(0.0, min(timeouts)) if timeouts else None, return_when=FIRST_COMPLETED)
+
+        now = time.perf_counter()
+        for entry in list(running):
+            vendor, futures, _ = entry
+            started_at = _vendor_started_at(futures)
+            if all(future.done() for future in futures):
+                running.remove(entry)
+                outcomes = [future.result() for future in futures]
+                vendor_results = [result for succeeded, result, _ in outcomes if succeeded]
+                _record_attempt(method, vendor, max(elapsed for _, _, elapsed in outcomes), outcomes)
+                if vendor_results:
+                    logger.debug("Vendor '%s' succeeded with %d result(s)", vendor, len(vendor_results))
+                    # Slower vendors still running have lost the race
+                    _abandon([f for _, others, _ in running for f in others])
+                    return vendor, vendor_results, attempts
+                logger.warning("Vendor '%s' produced no results for %s", vendor, method)
+            elif deadline is not None and started_at is not None and now - started_at >= deadline:
+                running.remove(entry)
+                _abandon(futures)
+                elapsed = now - started_at
+                _record_attempt(method, vendor, elapsed, [(False, FuturesTimeoutError(), elapsed)])
+                vendor_metrics.increment(method, vendor, "timeouts")
+                logger.warning("Vendor '%s' did not answer within %ss", vendor, deadline)
+
+        if remaining:
+            if not running:
+                launch()
+            elif (
+                hedge_after is not None
+                and running[-1][0] == newest_vendor
+                and now - newest_started >= hedge_after
+            ):
+                logger.info(
+                    "Vendor '%s' slower than its p95 (%.2fs), also starting next vendor",
+                    newest_vendor,
+                    hedge_after,
+                )
+                launch()
+
+    return None, [], attempts
+
+
 def route_to_vendor(method: str, *args, **kwargs):
     """Route method calls to appropriate vendor implementation with fallback support."""
     category = get_category_for_method(method)
@@ -158,10 +476,48 @@ def route_to_vendor(method: str, *args, **kwargs):
         if vendor not in fallback_vendors:
             fallback_vendors.append(vendor)
 
-    # Debug: Print fallback ordering
-    primary_str = " → ".join(primary_vendors)
-    fallback_str = " → ".join(fallback_vendors)
-    print(f"DEBUG: {method} - Primary: [{primary_str}] | Full fallback order: [{fallback_str}]")
+    # Optionally try the fastest fallbacks first, by observed median latency
+    health_config = get_config().get("vendor_health", {})
+    if health_config.get("reorder_fallbacks_by_latency", False):
+        fallback_vendors = primary_vendors + order_by_latency(
+            method, [v for v in fallback_vendors if v not in primary_vendors]
+        )
+
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "%s - Primary: [%s] | Full fallback order: [%s]",
+            method,
+            " → ".join(primary_vendors),
+            " → ".join(fallback_vendors),
+        )
+
+    # Serve repeated calls from the persistent response cache when enabled
+    cache = get_vendor_cache()
+    if cache is not None:
+        cache_key = cache.make_key(method, vendor_config, args, kwargs)
+        hit, cached_result = cache.get(cache_key, category)
+        if hit:
+            logger.debug("%s served from vendor cache", method)
+            return render_tool_results(method, cached_result)
+
+    # Independent implementations run concurrently when enabled. Multi-vendor
+    # configs collect results from every vendor, so all of them start at once;
+    # single-vendor configs only move on to a fallback after a failure.
+    parallel = get_config().get("parallel_vendor_calls", False)
+
+    # Vendors whose circuit is open are skipped until their cooldown ends. The
+    # circuit is only consulted right before a vendor is called, so half-open
+    # trial calls are not used up by vendors that never run.
+    pending = {}
+    blocked = set()
+    if parallel and len(primary_vendors) > 1:
+        for vendor in fallback_vendors:
+            if vendor not in VENDOR_METHODS[method]:
+                continue
+            if allow_call(method, vendor):
+                pending[vendor] = _submit_vendor_impls(method, vendor, args, kwargs)
+            else:
+                blocked.add(vendor)
 
     # Track results and execution state
     results = []
@@ -169,76 +525,89 @@ def route_to_vendor(method: str, *args, **kwargs):
     any_primary_vendor_attempted = False
     successful_vendor = None
 
-    for vendor in fallback_vendors:
-        if vendor not in VENDOR_METHODS[method]:
-            if vendor in primary_vendors:
-                print(f"INFO: Vendor '{vendor}' not supported for method '{method}', falling back to next vendor")
-            continue
+    deadline = _get_deadline(method)
+    hedging = get_config().get("vendor_hedging", {}).get("enabled", False)
+
+    if hedging and len(primary_vendors) == 1:
+        # Single-vendor configs stop at the first success, so slow vendors can be raced
+        candidates = [v for v in fallback_vendors if v in VENDOR_METHODS[method]]
+        successful_vendor, results, vendor_attempt_count = _route_hedged(
+            method, candidates, args, kwargs, deadline
+        )
+    else:
+        for vendor in fallback_vendors:
+            if vendor not in VENDOR_METHODS[method]:
+                if vendor in primary_vendors:
+                    logger.info("Vendor '%s' not supported for method '%s', falling back to next vendor", vendor, method)
+                continue
+            if vendor in blocked or (vendor not in pending and not allow_call(method, vendor)):
+                logger.info("Circuit open for vendor '%s' on %s, falling back to next vendor", vendor, method)
+                continue
 
-        vendor_impl = VENDOR_METHODS[method][vendor]
-        is_primary_vendor = vendor in primary_vendors
-        vendor_attempt_count += 1
+            vendor_impls = _get_vendor_impls(method, vendor)
+            is_primary_vendor = vendor in primary_vendors
+            vendor_attempt_count += 1
 
-        # Track if we attempted any primary vendor
-        if is_primary_vendor:
-            any_primary_vendor_attempted = True
+            # Track if we attempted any primary vendor
+            if is_primary_vendor:
+                any_primary_vendor_attempted = True
 
-        # Debug: Print current attempt
-        vendor_type = "PRIMARY" if is_primary_vendor else "FALLBACK"
-        print(f"DEBUG: Attempting {vendor_type} vendor '{vendor}' for {method} (attempt #{vendor_attempt_count})")
+            if not is_primary_vendor:
+                vendor_metrics.increment(method, vendor, "fallbacks")
+            logger.debug(
+                "Attempting %s vendor '%s' for %s (attempt #%d, %d implementation(s))",
+                "PRIMARY" if is_primary_vendor else "FALLBACK",
+                vendor,
+                method,
+                vendor_attempt_count,
+                len(vendor_impls),
+            )
 
-        # Handle list of methods for a vendor
-        if isinstance(vendor_impl, list):
-            vendor_methods = [(impl, vendor) for impl in vendor_impl]
-            print(f"DEBUG: Vendor '{vendor}' has multiple implementations: {len(vendor_methods)} functions")
-        else:
-            vendor_methods = [(vendor_impl, vendor)]
-
-        # Run methods for this vendor
-        vendor_results = []
-        for impl_func, vendor_name in vendor_methods:
-            try:
-                print(f"DEBUG: Calling {impl_func.__name__} from vendor '{vendor_name}'...")
-                result = impl_func(*args, **kwargs)
-                vendor_results.append(result)
-                print(f"SUCCESS: {impl_func.__name__} from vendor '{vendor_name}' completed successfully")
-                    
-            except AlphaVantageRateLimitError as e:
-                if vendor == "alpha_vantage":
-                    print(f"RATE_LIMIT: Alpha Vantage rate limit exceeded, falling back to next available vendor")
-                    print(f"DEBUG: Rate limit details: {e}")
-                # Continue to next vendor for fallback
-                continue
-            except Exception as e:
-                # Log error but continue with other implementations
-                print(f"FAILED: {impl_func.__name__} from vendor '{vendor_name}' failed: {e}")
-                continue
+            # Run methods for this vendor, keeping results in implementation order
+            concurrent = vendor in pending or (parallel and len(vendor_impls) > 1)
+            outcomes = _run_vendor(
+                method, vendor, args, kwargs, concurrent, pending.get(vendor), deadline
+            )
+            vendor_results = [result for succeeded, result, _ in outcomes if succeeded]
+
+            latencies = [elapsed for _, _, elapsed in outcomes]
+            _record_attempt(
+                method,
+                vendor,
+                max(latencies) if concurrent else sum(latencies),
+                outcomes,
+            )
 
-        # Add this vendor's results
-        if vendor_results:
-            results.extend(vendor_results)
-            successful_vendor = vendor
-            result_summary = f"Got {len(vendor_results)} result(s)"
-            print(f"SUCCESS: Vendor '{vendor}' succeeded - {result_summary}")
+            # Add this vendor's results
+            if vendor_results:
+                results.extend(vendor_results)
+                successful_vendor = vendor
+                logger.debug("Vendor '%s' succeeded with %d result(s)", vendor, len(vendor_results))
             
-            # Stopping logic: Stop after first successful vendor for single-vendor configs
-            # Multiple vendor configs (comma-separated) may want to collect from multiple sources
-            if len(primary_vendors) == 1:
-                print(f"DEBUG: Stopping after successful vendor '{vendor}' (single-vendor config)")
-                break
-        else:
-            print(f"FAILED: Vendor '{vendor}' produced no results")
+                # Stopping logic: Stop after first successful vendor for single-vendor configs
+                # Multiple vendor configs (comma-separated) may want to collect from multiple sources
+                if len(primary_vendors) == 1:
+                    break
+            else:
+                logger.warning("Vendor '%s' produced no results for %s", vendor, method)
 
     # Final result summary
     if not results:
-        print(f"FAILURE: All {vendor_attempt_count} vendor attempts failed for method '{method}'")
+        logger.error("All %d vendor attempts failed for method '%s'", vendor_attempt_count, method)
         raise RuntimeError(f"All vendor implementations failed for method '{method}'")
     else:
-        print(f"FINAL: Method '{method}' completed with {len(results)} result(s) from {vendor_attempt_count} vendor attempt(s)")
+        logger.debug(
+            "%s completed with %d result(s) from %d vendor attempt(s)",
+            method,
+            len(results),
+            vendor_attempt_count,
+        )
 
-    # Return single result if only one, otherwise concatenate as string
-    if len(results) == 1:
-        return results[0]
-    else:
-        # Convert all results to strings and concatenate
-        return '\n'.join(str(result) for result in results)
\ No newline at end of file
+    # Rendering drops the ErrorResult marker, so check the parts. The parts are
+    # cached separately so each source keeps its own share of the output budget.
+    failed = any(isinstance(r, ErrorResult) for r in results)
+    if cache is not None and not failed:
+        cache.put(cache_key, method, category, results, is_historical_call(args, kwargs))
+    # A single result is returned as is, several are rendered and joined as text
+    output = render_tool_results(method, results)
+    return ErrorResult(output) if failed else output
\ No newline at end of file
@@ -0,0 +1,171 @@
+import os
+import glob
+import json
+import shutil
+import threading
+from typing import Annotated, Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from .config import DATA_DIR
+
+# Every store is a directory holding one .npy file per column plus a meta.json
+# describing the column order. Dates are kept as a sorted datetime64[D] array so
+# range queries are two binary searches over a memory-mapped file.
+_DATES_FILE = "dates.npy"
+_META_FILE = "meta.json"
+
+_open_stores: Dict[str, "PriceStore"] = {}
+_open_stores_lock = threading.Lock()
+
+
+class PriceStore:
+    """Read-only view over a columnar daily price store on disk."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.mtime = os.path.getmtime(os.path.join(path, _META_FILE))
+        with open(os.path.join(path, _META_FILE), "r") as f:
+            self.meta = json.load(f)
+        self.date_column = self.meta.get("date_column", "Date")
+        self.columns = self.meta["columns"]
+        self.dates = np.load(os.path.join(path, _DATES_FILE), mmap_mode="r")
+        self._arrays = {
+            name: np.load(os.path.join(path, f"{i}.npy"), mmap_mode="r")
+            for i, name in enumerate(self.columns)
+        }
+
+    def __len__(self):
+        return len(self.dates)
+
+    @property
+    def first_date(self) -> Optional[str]:
+        return str(self.dates[0]) if len(self.dates) else None
+
+    @property
+    def last_date(self) -> Optional[str]:
+        return str(self.dates[-1]) if len(self.dates) else None
+
+    def _bounds(self, start_date: Optional[str], end_date: Optional[str]):
+        lo = 0
+        hi = len(self.dates)
+        if start_date:
+            lo = int(np.searchsorted(self.dates, np.datetime64(start_date[:10], "D"), side="left"))
+        if end_date:
+            hi = int(np.searchsorted(self.dates, np.datetime64(end_date[:10], "D"), side="right"))
+        return lo, max(lo, hi)
+
+    def slice(
+        self,
+        start_date: Annotated[Optional[str], "Start date in yyyy-mm-dd format (inclusive)"] = None,
+        end_date: Annotated[Optional[str], "End date in yyyy-mm-dd format (inclusive)"] = None,
+    ) -> pd.DataFrame:
+        """Return the rows between start_date and end_date (inclusive) as a DataFrame."""
+        lo, hi = self._bounds(start_date, end_date)
+        data = {
+            self.date_column: pd.DatetimeIndex(np.asarray(self.dates[lo:hi])).strftime("%Y-%m-%d")
+        }
+        for name in self.columns:
+            data[name] = np.asarray(self._arrays[name][lo:hi])
+        return pd.DataFrame(data)
+
+
+def write_price_store(
+    path: Annotated[str, "Directory to write the store to"],
+    data: Annotated[pd.DataFrame, "Daily price rows with a date column"],
+    date_column: Annotated[str, "Name of the date column in data"] = "Date",
+    extra_meta: Annotated[Optional[dict], "Additional metadata saved alongside the store"] = None,
+) -> None:
+    """Write a DataFrame as a columnar store, sorted and de-duplicated by date.
+
+    Only numeric columns are kept. The store is written to a temporary directory
+    and swapped into place so concurrent readers never see a partial store.
+    """
+    data = data.copy()
+    dates = pd.to_datetime(data[date_column].astype(str).str[:10])
+    data = data.drop(columns=[date_column])
+    data.insert(0, "__date__", dates.values.astype("datetime64[D]"))
+    data = (
+        data.drop_duplicates(subset="__date__", keep="last")
+        .sort_values("__date__")
+        .reset_index(drop=True)
+    )
+    numeric = data.drop(columns=["__date__"]).select_dtypes(include="number")
+
+    parent = os.path.dirname(os.path.abspath(path))
+    os.makedirs(parent, exist_ok=True)
+    tmp_path = f"{path}.tmp-{os.getpid()}-{threading.get_ident()}"
+    shutil.rmtree(tmp_path, ignore_errors=True)
+    os.makedirs(tmp_path)
+
+    np.save(os.path.join(tmp_path, _DATES_FILE), data["__date__"].values.astype("datetime64[D]"))
+    for i, name in enumerate(numeric.columns):
+        np.save(os.path.join(tmp_path, f"{i}.npy"), numeric[name].to_numpy())
+
+    meta = dict(extra_meta or {})
+    meta.update({"date_column": date_column, "columns": list(numeric.columns)})
+    with open(os.path.join(tmp_path, _META_FILE), "w") as f:
+        json.dump(meta, f)
+
+    old_path = f"{path}.old-{os.getpid()}-{threading.get_ident()}"
+    if os.path.exists(path):
+        os.replace(path, old_path)
+    os.replace(tmp_path, path)
+    shutil.rmtree(old_path, ignore_errors=True)
+
+    with _open_stores_lock:
+        _open_stores.pop(os.path.abspath(path), None)
+
+
+def open_price_store(
+    path: Annotated[str, "Directory of the store"],
+) -> Optional[PriceStore]:
+    """Open (once per process) the store at path, or return None if it does not exist."""
+    key = os.path.abspath(path)
+    meta_path = os.path.join(key, _META_FILE)
+    try:
+        mtime = os.path.getmtime(meta_path)
+    except OSError:
+        return None
+
+    with _open_stores_lock:
+        store = _open_stores.get(key)
+        if store is None or store.mtime != mtime:
+            store = PriceStore(key)
+            _open_stores[key] = store
+        return store
+
+
+def get_local_price_store_path(
+    symbol: Annotated[str, "ticker symbol of the company"],
+    data_dir: Annotated[Optional[str], "Root data directory, defaults to DATA_DIR"] = None,
+) -> str:
+    return os.path.join(data_dir or DATA_DIR, "market_data", "price_store", symbol.upper())
+
+
+def convert_price_csvs(
+    data_dir: Annotated[Optional[str], "Root data directory, defaults to DATA_DIR"] = None,
+) -> list:
+    """Import every {symbol}-YFin-data-*.csv under market_data/price_data into the price store.
+
+    Returns:
+        list: the symbols that were converted
+    """
+    data_dir = data_dir or DATA_DIR
+    csv_dir = os.path.join(data_dir, "market_data", "price_data")
+
+    converted = []
+    for csv_path in sorted(glob.glob(os.path.join(csv_dir, "*-YFin-data-*.csv"))):
+        symbol = os.path.basename(csv_path).split("-YFin-data-")[0]
+        data = pd.read_csv(csv_path)
+        write_price_store(get_local_price_store_path(symbol, data_dir), data)
+        converted.append(symbol)
+        print(f"Converted {csv_path} ({len(data)} rows)")
+
+    return converted
+
+
+if __name__ == "__main__":
+    symbols = convert_price_csvs()
+    print(f"Converted {len(symbols)} symbols into the price store")
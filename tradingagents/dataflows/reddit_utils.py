@@ -6,6 +6,9 @@ from contextlib import contextmanager
 from typing import Annotated
 import os
 import re
+import shutil
+from collections import defaultdict, deque
+from functools import lru_cache
 
 ticker_to_company = {
     "AAPL": "Apple",
@@ -49,6 +52,205 @@ ticker_to_company = {
 }
 
 
+# Directory (inside the reddit data folder) holding the date-partitioned index
+# written by build_reddit_index: {category}/{subreddit}/{YYYY-MM-DD}.jsonl, with
+# the posts of each partition sorted by upvotes in descending order.
+REDDIT_INDEX_DIR = "_index"
+# Inverted index of company news: {category}/_mentions/{YYYY-MM-DD}.json maps
+# each ticker to the ids of the posts mentioning it, per subreddit.
+REDDIT_MENTIONS_DIR = "_mentions"
+
+
+def _parse_post(parsed_line):
+    return {
+        "id": parsed_line.get("id"),
+        "title": parsed_line["title"],
+        "content": parsed_line["selftext"],
+        "url": parsed_line["url"],
+        "upvotes": parsed_line["ups"],
+        "posted_date": datetime.utcfromtimestamp(
+            parsed_line["created_utc"]
+        ).strftime("%Y-%m-%d"),
+    }
+
+
+def _mentions_company(post, query):
+    """Check that the title or the content has the company's name (query) mentioned"""
+    search_terms = []
+    if "OR" in ticker_to_company[query]:
+        search_terms = ticker_to_company[query].split(" OR ")
+    else:
+        search_terms = [ticker_to_company[query]]
+
+    search_terms.append(query)
+
+    for term in search_terms:
+        if re.search(term, post["title"], re.IGNORECASE) or re.search(
+            term, post["content"], re.IGNORECASE
+        ):
+            return True
+    return False
+
+
+class MultiPatternMatcher:
+    """Aho-Corasick automaton that finds every pattern occurring in a text in one pass.
+
+    Patterns are matched literally and case-insensitively, and each pattern maps
+    to the set of labels (e.g. tickers) reported when it occurs.
+    """
+
+    def __init__(self, patterns: dict):
+        self.goto = [{}]
+        self.fail = [0]
+        self.out = [set()]
+
+        for pattern, labels in patterns.items():
+            node = 0
+            for ch in pattern.lower():
+                nxt = self.goto[node].get(ch)
+                if nxt is None:
+                    nxt = len(self.goto)
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.out.append(set())
+                    self.goto[node][ch] = nxt
+                node = nxt
+            self.out[node] |= set(labels)
+
+        # breadth-first pass to set failure links and merge outputs
+        queue = deque(self.goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, nxt in self.goto[node].items():
+                queue.append(nxt)
+                fail = self.fail[node]
+                while fail and ch not in self.goto[fail]:
+                    fail = self.fail[fail]
+                self.fail[nxt] = self.goto[fail].get(ch, 0)
+                self.out[nxt] |= self.out[self.fail[nxt]]
+
+    def find(self, text: str) -> set:
+        """Return the labels of every pattern occurring in text."""
+        found = set()
+        node = 0
+        for ch in text.lower():
+            while node and ch not in self.goto[node]:
+                node = self.fail[node]
+            node = self.goto[node].get(ch, 0)
+            if self.out[node]:
+                found |= self.out[node]
+        return found
+
+
+def build_company_matcher() -> MultiPatternMatcher:
+    """Matcher over every alias in ticker_to_company (and the tickers themselves)."""
+    patterns = defaultdict(set)
+    for ticker, names in ticker_to_company.items():
+        for alias in names.split(" OR ") + [ticker]:
+            patterns[alias].add(ticker)
+    return MultiPatternMatcher(patterns)
+
+
+def build_reddit_index(
+    data_path: Annotated[str, "Path to the data folder."] = "reddit_data",
+) -> str:
+    """Partition every category's subreddit dumps by date in one pass.
+
+    Posts of each (category, subreddit, date) partition are written pre-sorted
+    by upvotes, so fetching the top posts of a day only reads that day's files.
+
+    Returns:
+        str: the path of the index
+    """
+    index_path = os.path.join(data_path, REDDIT_INDEX_DIR)
+    tmp_path = index_path + ".tmp"
+    shutil.rmtree(tmp_path, ignore_errors=True)
+    company_matcher = build_company_matcher()
+
+    for category in os.listdir(data_path):
+        category_path = os.path.join(data_path, category)
+        if category.startswith(REDDIT_INDEX_DIR) or not os.path.isdir(category_path):
+            continue
+
+        # ticker -> subreddit -> post ids, per date, for company news categories
+        mentions_by_date = defaultdict(lambda: defaultdict(lambda: defaultdict(list)))
+
+        for data_file in os.listdir(category_path):
+            if not data_file.endswith(".jsonl"):
+                continue
+            subreddit = data_file[: -len(".jsonl")]
+
+            posts_by_date = defaultdict(list)
+            with open(os.path.join(category_path, data_file), "rb") as f:
+                for i, line in enumerate(f):
+                    if not line.strip():
+                        continue
+                    post = _parse_post(json.loads(line))
+                    if post["id"] is None:
+                        post["id"] = f"{data_file}:{i}"
+                    posts_by_date[post["posted_date"]].append(post)
+
+            subreddit_path = os.path.join(tmp_path, category, subreddit)
+            os.makedirs(subreddit_path, exist_ok=True)
+            for date, posts in posts_by_date.items():
+                posts.sort(key=lambda x: x["upvotes"], reverse=True)
+                with open(os.path.join(subreddit_path, f"{date}.jsonl"), "w") as f:
+                    for post in posts:
+                        f.write(json.dumps(post) + "\n")
+
+                if "company" in category:
+                    for post in posts:
+                        tickers = company_matcher.find(post["title"]) | company_matcher.find(
+                            post["content"]
+                        )
+                        for ticker in tickers:
+                            mentions_by_date[date][ticker][subreddit].append(post["id"])
+
+        if mentions_by_date:
+            mentions_path = os.path.join(tmp_path, category, REDDIT_MENTIONS_DIR)
+            os.makedirs(mentions_path, exist_ok=True)
+            for date, mentions in mentions_by_date.items():
+                with open(os.path.join(mentions_path, f"{date}.json"), "w") as f:
+                    json.dump(mentions, f)
+
+    shutil.rmtree(index_path, ignore_errors=True)
+    os.makedirs(tmp_path, exist_ok=True)
+    os.replace(tmp_path, index_path)
+    return index_path
+
+
+def _read_partition(index_path, category, data_file, date):
+    partition = os.path.join(
+        index_path, category, data_file[: -len(".jsonl")], f"{date}.jsonl"
+    )
+    if not os.path.exists(partition):
+        return
+    with open(partition, "r") as f:
+        for line in f:
+            yield json.loads(line)
+
+
+@lru_cache(maxsize=256)
+def _load_mentions(mentions_file, mtime):
+    with open(mentions_file, "r") as f:
+        return json.load(f)
+
+
+def _mentioned_post_ids(index_path, category, date, query):
+    """Ids of the posts mentioning query on date, per subreddit, or None without an inverted index."""
+    mentions_dir = os.path.join(index_path, category, REDDIT_MENTIONS_DIR)
+    if not os.path.isdir(mentions_dir):
+        return None
+    mentions_file = os.path.join(mentions_dir, f"{date}.json")
+    if not os.path.exists(mentions_file):
+        return {}
+    mentions = _load_mentions(mentions_file, os.path.getmtime(mentions_file))
+    return {
+        subreddit: set(post_ids)
+        for subreddit, post_ids in mentions.get(query, {}).items()
+    }
+
+
 def fetch_top_from_category(
     category: Annotated[
         str, "Category to fetch top post from. Collection of subreddits."
@@ -74,6 +276,12 @@ def fetch_top_from_category(
         os.listdir(os.path.join(base_path, category))
     )
 
+    index_path = os.path.join(base_path, REDDIT_INDEX_DIR)
+    use_index = os.path.isdir(os.path.join(index_path, category))
+    mentioned_ids = None
+    if use_index and "company" in category and query:
+        mentioned_ids = _mentioned_post_ids(index_path, category, date, query)
+
     for data_file in os.listdir(os.path.join(base_path, category)):
         # check if data_file is a .jsonl file
         if not data_file.endswith(".jsonl"):
@@ -81,49 +289,43 @@ def fetch_top_from_category(
 
         all_content_curr_subreddit = []
 
+        if use_index:
+            if mentioned_ids is not None:
+                post_ids = mentioned_ids.get(data_file[: -len(".jsonl")])
+                if not post_ids:
+                    continue
+
+            # partitions are already restricted to the date and sorted by upvotes
+            for post in _read_partition(index_path, category, data_file, date):
+                if mentioned_ids is not None:
+                    if post["id"] not in post_ids:
+                        continue
+                elif "company" in category and query and not _mentions_company(post, query):
+                    continue
+                post.pop("id", None)
+                all_content_curr_subreddit.append(post)
+                if len(all_content_curr_subreddit) >= limit_per_subreddit:
+                    break
+
+            all_content.extend(all_content_curr_subreddit)
+            continue
+
         with open(os.path.join(base_path, category, data_file), "rb") as f:
             for i, line in enumerate(f):
                 # skip empty lines
                 if not line.strip():
                     continue
 
-                parsed_line = json.loads(line)
+                post = _parse_post(json.loads(line))
+                post.pop("id", None)
 
                 # select only lines that are from the date
-                post_date = datetime.utcfromtimestamp(
-                    parsed_line["created_utc"]
-                ).strftime("%Y-%m-%d")
-                if post_date != date:
+                if post["posted_date"] != date:
                     continue
 
                 # if is company_news, check that the title or the content has the company's name (query) mentioned
-                if "company" in category and query:
-                    search_terms = []
-                    if "OR" in ticker_to_company[query]:
-                        search_terms = ticker_to_company[query].split(" OR ")
-                    else:
-                        search_terms = [ticker_to_company[query]]
-
-                    search_terms.append(query)
-
-                    found = False
-                    for term in search_terms:
-                        if re.search(
-                            term, parsed_line["title"], re.IGNORECASE
-                        ) or re.search(term, parsed_line["selftext"], re.IGNORECASE):
-                            found = True
-                            break
-
-                    if not found:
-                        continue
-
-                post = {
-                    "title": parsed_line["title"],
-                    "content": parsed_line["selftext"],
-                    "url": parsed_line["url"],
-                    "upvotes": parsed_line["ups"],
-                    "posted_date": post_date,
-                }
+                if "company" in category and query and not _mentions_company(post, query):
+                    continue
 
                 all_content_curr_subreddit.append(post)
 
@@ -0,0 +1,260 @@
+import re
+import json
+from io import StringIO
+from typing import Annotated, Any, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .config import get_config
+
+# Vendor results are passed to the LLM as tool messages, and every later turn of
+# the analyst loop pays for them again. This module turns them into compact text
+# that fits the configured "tool_output_budget": long price windows become
+# summary statistics plus sampled rows, news keeps a few trimmed fields per
+# article, and statements keep only line items that have a value.
+CHARS_PER_TOKEN = 4
+
+STATEMENT_METHODS = {"get_balance_sheet", "get_cashflow", "get_income_statement"}
+
+_NULL_LINE = re.compile(r"\s(NaN|nan|None|NaT|<NA>)\s*$")
+_DATE_COLUMNS = ("Date", "date", "timestamp")
+_CLOSE_COLUMNS = ("Close", "close", "Adj Close", "adjusted_close")
+_HIGH_COLUMNS = ("High", "high")
+_LOW_COLUMNS = ("Low", "low")
+_VOLUME_COLUMNS = ("Volume", "volume")
+
+
+def _budget() -> dict:
+    return get_config().get("tool_output_budget", {})
+
+
+def _first_column(df: pd.DataFrame, candidates) -> Any:
+    for name in candidates:
+        if name in df.columns:
+            return name
+    return None
+
+
+def fit_to_budget(
+    text: Annotated[str, "text to shorten"],
+    max_tokens: Annotated[int, "approximate token budget"],
+    source: Annotated[str, "which part of a combined result this is, named in the marker"] = "",
+) -> str:
+    """Cut text at a line boundary so it fits max_tokens, noting how much was dropped."""
+    max_chars = max_tokens * CHARS_PER_TOKEN
+    if len(text) <= max_chars:
+        return text
+    cut = text.rfind("\n", 0, max_chars)
+    if cut <= 0:
+        cut = max_chars
+    of_source = f" of {source}" if source else ""
+    return text[:cut] + (
+        f"\n... [truncated {len(text) - cut} characters{of_source} to fit the tool output budget]"
+    )
+
+
+def _split_comment_header(text: str) -> Tuple[List[str], str]:
+    """Separate leading '# ...' lines (and blank lines) from a CSV body."""
+    lines = text.splitlines()
+    i = 0
+    while i < len(lines) and (lines[i].startswith("#") or not lines[i].strip()):
+        i += 1
+    return lines[:i], "\n".join(lines[i:])
+
+
+def _sample_rows(df: pd.DataFrame, max_rows: int) -> pd.DataFrame:
+    """Keep the most recent third of max_rows and evenly spaced rows from the rest."""
+    recent = max(1, max_rows // 3)
+    older = df.iloc[:-recent]
+    picks = np.unique(np.linspace(0, len(older) - 1, max_rows - recent).round().astype(int))
+    return pd.concat([older.iloc[picks], df.iloc[-recent:]])
+
+
+def render_price_frame(
+    df: Annotated[pd.DataFrame, "daily price rows with a date column"],
+    max_rows: Annotated[int, "rows to show at most"],
+) -> str:
+    """Render a price window as summary statistics plus sampled rows, oldest first."""
+    date_col = _first_column(df, _DATE_COLUMNS)
+    if date_col is None and isinstance(df.index, pd.DatetimeIndex):
+        df = df.reset_index().rename(columns={df.index.name or "index": "Date"})
+        date_col = "Date"
+    if date_col is None or len(df) <= max_rows:
+        return df.to_csv(index=False)
+
+    df = df.assign(**{date_col: df[date_col].astype(str).str[:10]})
+    df = df.sort_values(date_col, kind="mergesort").reset_index(drop=True)
+
+    summary = [f"# {len(df)} trading days from {df[date_col].iloc[0]} to {df[date_col].iloc[-1]}"]
+    close = _first_column(df, _CLOSE_COLUMNS)
+    if close is not None:
+        first, last = float(df[close].iloc[0]), float(df[close].iloc[-1])
+        change = (last / first - 1) * 100 if first else float("nan")
+        summary.append(
+            f"# {close}: first {first:.2f}, last {last:.2f} ({change:+.2f}%), "
+            f"mean {df[close].mean():.2f}, std {df[close].std():.2f}"
+        )
+        returns = df[close].pct_change().dropna()
+        if len(returns):
+            summary.append(f"# Daily return volatility: {returns.std() * 100:.2f}%")
+    high, low = _first_column(df, _HIGH_COLUMNS), _first_column(df, _LOW_COLUMNS)
+    if high is not None and low is not None:
+        hi_idx, lo_idx = df[high].idxmax(), df[low].idxmin()
+        summary.append(
+            f"# Range: high {df[high].iloc[hi_idx]:.2f} on {df[date_col].iloc[hi_idx]}, "
+            f"low {df[low].iloc[lo_idx]:.2f} on {df[date_col].iloc[lo_idx]}"
+        )
+    volume = _first_column(df, _VOLUME_COLUMNS)
+    if volume is not None:
+        summary.append(f"# Average volume: {df[volume].mean():,.0f}")
+
+    sampled = _sample_rows(df, max_rows).round(2)
+    summary.append(f"# Showing {len(sampled)} of {len(df)} rows (evenly sampled, most recent in full)")
+    return "\n".join(summary) + "\n\n" + sampled.to_csv(index=False)
+
+
+def _render_price_text(text: str, max_rows: int) -> str:
+    header, body = _split_comment_header(text)
+    try:
+        df = pd.read_csv(StringIO(body))
+    except Exception:
+        return text
+    if len(df) <= max_rows or _first_column(df, _DATE_COLUMNS) is None:
+        return text
+    header = [line for line in header if line.strip()]
+    prefix = "\n".join(header) + "\n" if header else ""
+    return prefix + render_price_frame(df, max_rows)
+
+
+def _render_news_json(text: str, max_items: int, max_summary_chars: int) -> str:
+    """Trim an Alpha Vantage NEWS_SENTIMENT response to a few fields per article."""
+    try:
+        data = json.loads(text)
+    except (TypeError, ValueError):
+        return text
+    if not isinstance(data, dict) or "feed" not in data:
+        return text
+
+    feed = data["feed"]
+    lines = [f"# {len(feed)} articles, showing {min(len(feed), max_items)}"]
+    for article in feed[:max_items]:
+        published = str(article.get("time_published", ""))
+        if len(published) >= 8:
+            published = f"{published[:4]}-{published[4:6]}-{published[6:8]}"
+        summary = str(article.get("summary", ""))
+        if len(summary) > max_summary_chars:
+            summary = summary[:max_summary_chars].rsplit(" ", 1)[0] + "..."
+        sentiment = article.get("overall_sentiment_label")
+        lines.append(
+            f"### {article.get('title', '')} ({article.get('source', '')}, {published})"
+            + (f" [sentiment: {sentiment}]" if sentiment else "")
+        )
+        lines.append(summary)
+    return "\n".join(lines)
+
+
+def render_statement_series(
+    series: Annotated[pd.Series, "one statement, indexed by line item"],
+) -> str:
+    """Render a statement with only the line items that have a value.
+
+    Falls back to the plain pandas rendering when the budget is disabled.
+    """
+    if not _budget().get("enabled", False):
+        return str(series)
+    return series.dropna().to_string()
+
+
+def _render_statement_text(text: str, max_tokens: int) -> str:
+    # Alpha Vantage statements: JSON reports with "None" for missing items
+    try:
+        data = json.loads(text)
+    except (TypeError, ValueError):
+        data = None
+    if isinstance(data, dict) and any(key.endswith("Reports") for key in data):
+        report_keys = [k for k, v in data.items() if k.endswith("Reports") and isinstance(v, list)]
+        for key in report_keys:
+            data[key] = [
+                {k: v for k, v in report.items() if v not in (None, "None", "")}
+                for report in data[key]
+            ]
+        # Drop the oldest reports of the longest list until the JSON fits
+        rendered = json.dumps(data, separators=(",", ":"))
+        while len(rendered) > max_tokens * CHARS_PER_TOKEN:
+            key = max(report_keys, key=lambda k: len(data[k]))
+            if len(data[key]) <= 1:
+                break
+            data[key] = data[key][:-1]
+            rendered = json.dumps(data, separators=(",", ":"))
+        return rendered
+
+    # yfinance statements: CSV with line items as rows and periods as columns
+    header, body = _split_comment_header(text)
+    if header and body and "," in body.split("\n", 1)[0]:
+        try:
+            df = pd.read_csv(StringIO(body), index_col=0)
+            prefix = "\n".join(header) + "\n"
+            return prefix + df.dropna(how="all").to_csv()
+        except Exception:
+            pass
+
+    # Text renderings of a pandas Series: drop the lines without a value
+    return "\n".join(line for line in text.splitlines() if not _NULL_LINE.search(line))
+
+
+def _render(method: str, result: Any, budget: dict) -> str:
+    """Render one vendor result compactly, before the overall length cut."""
+    max_rows = budget.get("max_price_rows", 30)
+    if method == "get_stock_data":
+        if isinstance(result, pd.DataFrame):
+            result = render_price_frame(result, max_rows)
+        elif isinstance(result, str):
+            result = _render_price_text(result, max_rows)
+    elif method == "get_news" and isinstance(result, str):
+        result = _render_news_json(
+            result, budget.get("max_news_items", 15), budget.get("max_news_summary_chars", 300)
+        )
+    elif method in STATEMENT_METHODS and isinstance(result, str):
+        result = _render_statement_text(result, budget.get("max_tokens", 3000))
+    return result if isinstance(result, str) else str(result)
+
+
+def render_tool_output(
+    method: Annotated[str, "vendor method the result came from"],
+    result: Annotated[Any, "result returned by the vendor"],
+) -> Any:
+    """Render a vendor result compactly within the configured token budget."""
+    budget = _budget()
+    if not budget.get("enabled", False):
+        return result
+    return fit_to_budget(_render(method, result, budget), budget.get("max_tokens", 3000))
+
+
+def render_tool_results(
+    method: Annotated[str, "vendor method the results came from"],
+    results: Annotated[List[Any], "results of each vendor or implementation, in order"],
+) -> Any:
+    """Render the results of several sources within one shared token budget.
+
+    Each source is rendered and cut on its own, so a long first source cannot
+    push the later ones out. Sources shorter than an even share keep their full
+    text and leave the remainder to the longer ones.
+    """
+    if len(results) == 1:
+        return render_tool_output(method, results[0])
+    budget = _budget()
+    if not budget.get("enabled", False):
+        return "\n".join(str(result) for result in results)
+
+    rendered = [_render(method, result, budget) for result in results]
+    remaining = budget.get("max_tokens", 3000) * CHARS_PER_TOKEN
+    shares = {}
+    by_length = sorted(range(len(rendered)), key=lambda i: len(rendered[i]))
+    for n, i in enumerate(by_length):
+        shares[i] = remaining // (len(rendered) - n)
+        remaining -= min(len(rendered[i]), shares[i])
+    return "\n".join(
+        fit_to_budget(text, shares[i] // CHARS_PER_TOKEN, f"source {i + 1} of {len(rendered)}")
+        for i, text in enumerate(rendered)
+    )
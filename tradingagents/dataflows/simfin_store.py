@@ -0,0 +1,183 @@
+import os
+import threading
+from typing import Annotated, Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .config import DATA_DIR
+
+# SimFin bulk CSVs cover every US company in one file per statement and
+# frequency. The store splits each of them once into per-ticker pickles sorted
+# by publish date, so a lookup only loads one small partition and finds the
+# latest statement published on or before a date by binary search. The store is
+# built explicitly (build_simfin_stores, or `data sync --build-indexes`); until
+# then, or once the CSV has changed, lookups filter the CSV directly.
+SIMFIN_STATEMENTS = {
+    "balance_sheet": "us-balance-{freq}.csv",
+    "cash_flow": "us-cashflow-{freq}.csv",
+    "income_statements": "us-income-{freq}.csv",
+}
+
+_BUILT_MARKER = "_built_from_mtime"
+
+_partitions: Dict[Tuple[str, str], Optional[Tuple[np.ndarray, pd.DataFrame]]] = {}
+_partitions_lock = threading.Lock()
+
+
+def _csv_path(statement: str, freq: str, data_dir: str) -> str:
+    return os.path.join(
+        data_dir,
+        "fundamental_data",
+        "simfin_data_all",
+        statement,
+        "companies",
+        "us",
+        SIMFIN_STATEMENTS[statement].format(freq=freq),
+    )
+
+
+def _store_dir(statement: str, freq: str, data_dir: str) -> str:
+    return os.path.join(data_dir, "fundamental_data", "simfin_store", statement, freq)
+
+
+def _partition_file(store_dir: str, ticker: str) -> str:
+    return os.path.join(store_dir, f"{ticker.replace(os.sep, '_')}.pkl")
+
+
+def build_simfin_store(
+    statement: Annotated[str, "one of balance_sheet, cash_flow, income_statements"],
+    freq: Annotated[str, "reporting frequency: annual / quarterly"],
+    data_dir: Annotated[Optional[str], "Root data directory, defaults to DATA_DIR"] = None,
+) -> str:
+    """Partition one SimFin bulk CSV into per-ticker files sorted by publish date.
+
+    Returns:
+        str: the directory of the partitioned store
+    """
+    data_dir = data_dir or DATA_DIR
+    csv_path = _csv_path(statement, freq, data_dir)
+    store_dir = _store_dir(statement, freq, data_dir)
+
+    df = pd.read_csv(csv_path, sep=";")
+
+    # Convert date strings to datetime objects and remove any time components
+    df["Report Date"] = pd.to_datetime(df["Report Date"], utc=True).dt.normalize()
+    df["Publish Date"] = pd.to_datetime(df["Publish Date"], utc=True).dt.normalize()
+
+    os.makedirs(store_dir, exist_ok=True)
+    for ticker, rows in df.groupby("Ticker", sort=False):
+        rows = rows.sort_values("Publish Date", kind="mergesort")
+        rows.to_pickle(_partition_file(store_dir, str(ticker)))
+
+    with open(os.path.join(store_dir, _BUILT_MARKER), "w") as f:
+        f.write(str(os.path.getmtime(csv_path)))
+
+    with _partitions_lock:
+        for key in [k for k in _partitions if k[0] == store_dir]:
+            del _partitions[key]
+
+    return store_dir
+
+
+def build_simfin_stores(
+    data_dir: Annotated[Optional[str], "Root data directory, defaults to DATA_DIR"] = None,
+) -> list:
+    """Partition every SimFin bulk CSV present under data_dir into the store.
+
+    Returns:
+        list: the (statement, freq) pairs that were built
+    """
+    data_dir = data_dir or DATA_DIR
+    built = []
+    for statement in SIMFIN_STATEMENTS:
+        for freq in ("annual", "quarterly"):
+            if os.path.exists(_csv_path(statement, freq, data_dir)):
+                build_simfin_store(statement, freq, data_dir)
+                built.append((statement, freq))
+                print(f"Built the {freq} {statement} store")
+    return built
+
+
+def _store_is_current(statement: str, freq: str, data_dir: str) -> bool:
+    """Whether the store exists and was built from the current version of its CSV."""
+    marker = os.path.join(_store_dir(statement, freq, data_dir), _BUILT_MARKER)
+    try:
+        with open(marker, "r") as f:
+            built_from = f.read().strip()
+    except OSError:
+        return False
+    csv_path = _csv_path(statement, freq, data_dir)
+    return not os.path.exists(csv_path) or built_from == str(os.path.getmtime(csv_path))
+
+
+def _load_partition(store_dir: str, ticker: str) -> Optional[Tuple[np.ndarray, pd.DataFrame]]:
+    key = (store_dir, ticker)
+    with _partitions_lock:
+        if key in _partitions:
+            return _partitions[key]
+
+    path = _partition_file(store_dir, ticker)
+    if os.path.exists(path):
+        rows = pd.read_pickle(path)
+        partition = (rows["Publish Date"].values, rows)
+    else:
+        partition = None
+
+    with _partitions_lock:
+        _partitions[key] = partition
+    return partition
+
+
+def get_latest_statement(
+    statement: Annotated[str, "one of balance_sheet, cash_flow, income_statements"],
+    ticker: Annotated[str, "ticker symbol"],
+    freq: Annotated[str, "reporting frequency: annual / quarterly"],
+    curr_date: Annotated[str, "current date you are trading at, yyyy-mm-dd"],
+    data_dir: Annotated[Optional[str], "Root data directory, defaults to DATA_DIR"] = None,
+) -> Optional[pd.Series]:
+    """Return the latest statement published on or before curr_date, or None if there is none."""
+    data_dir = data_dir or DATA_DIR
+
+    # Convert the current date to datetime and normalize
+    curr_date_dt = pd.to_datetime(curr_date, utc=True).normalize()
+
+    if not _store_is_current(statement, freq, data_dir):
+        return _latest_from_csv(statement, ticker, freq, curr_date_dt, data_dir)
+
+    partition = _load_partition(_store_dir(statement, freq, data_dir), ticker)
+    if partition is None:
+        return None
+    publish_dates, rows = partition
+
+    idx = int(np.searchsorted(publish_dates, curr_date_dt.to_datetime64(), side="right")) - 1
+    if idx < 0:
+        return None
+
+    # Several statements can share a publish date; keep the first, like idxmax
+    idx = int(np.searchsorted(publish_dates, publish_dates[idx], side="left"))
+    return rows.iloc[idx]
+
+
+def _latest_from_csv(
+    statement: str, ticker: str, freq: str, curr_date_dt: pd.Timestamp, data_dir: str
+) -> Optional[pd.Series]:
+    """Filter the bulk CSV for the latest statement, for when no current store exists."""
+    df = pd.read_csv(_csv_path(statement, freq, data_dir), sep=";")
+
+    # Convert date strings to datetime objects and remove any time components
+    df["Report Date"] = pd.to_datetime(df["Report Date"], utc=True).dt.normalize()
+    df["Publish Date"] = pd.to_datetime(df["Publish Date"], utc=True).dt.normalize()
+
+    # Filter the DataFrame for the given ticker and for reports that were published on or before the current date
+    filtered_df = df[(df["Ticker"] == ticker) & (df["Publish Date"] <= curr_date_dt)]
+    if filtered_df.empty:
+        return None
+
+    # Get the most recent statement by selecting the row with the latest Publish Date
+    return filtered_df.loc[filtered_df["Publish Date"].idxmax()]
+
+
+if __name__ == "__main__":
+    stores = build_simfin_stores()
+    print(f"Built {len(stores)} SimFin statement stores")
@@ -1,82 +1,123 @@
 import pandas as pd
-import yfinance as yf
 from stockstats import wrap
 from typing import Annotated
 import os
+import threading
+from collections import OrderedDict
 from .config import get_config, DATA_DIR
+from .price_store import open_price_store, get_local_price_store_path
+from .yfin_cache import get_yfin_store_path, load_yfin_history
+
+# Wrapped price frames keyed by their source, so that every indicator requested
+# for a symbol during one session reuses a single load (stockstats keeps the
+# computed indicator columns on the frame as well). Each frame holds a symbol's
+# full history, so only the stockstats_frame_cache_size most recently used are kept.
+_stock_frames = OrderedDict()
+_stock_frames_lock = threading.Lock()
+# stockstats adds indicator columns in place, so computing on a shared frame is serialized
+_indicator_lock = threading.Lock()
 
 
 class StockstatsUtils:
     @staticmethod
-    def get_stock_stats(
+    def get_stock_data(
         symbol: Annotated[str, "ticker symbol for the company"],
-        indicator: Annotated[
-            str, "quantitative indicators based off of the stock data for the company"
-        ],
-        curr_date: Annotated[
-            str, "curr date for retrieving stock price data, YYYY-mm-dd"
-        ],
+        memoize: Annotated[bool, "reuse and keep the frame in the per-symbol memo"] = True,
     ):
+        """Load the price history for symbol wrapped with stockstats.
+
+        The returned frame has a "Date" column formatted as YYYY-mm-dd.
+        """
         # Get config and set up data directory path
         config = get_config()
         online = config["data_vendors"]["technical_indicators"] != "local"
 
-        df = None
-        data = None
-
         if not online:
-            try:
-                data = pd.read_csv(
-                    os.path.join(
-                        DATA_DIR,
-                        f"{symbol}-YFin-data-2015-01-01-2025-03-25.csv",
-                    )
+            store_path = get_local_price_store_path(symbol, DATA_DIR)
+            store = open_price_store(store_path)
+            if store is not None:
+                source = (store_path, store.mtime)
+            else:
+                source = os.path.join(
+                    DATA_DIR,
+                    f"{symbol}-YFin-data-2015-01-01-2025-03-25.csv",
                 )
-                df = wrap(data)
-            except FileNotFoundError:
-                raise Exception("Stockstats fail: Yahoo Finance data not fetched yet!")
         else:
-            # Get today's date as YYYY-mm-dd to add to cache
-            today_date = pd.Timestamp.today()
-            curr_date = pd.to_datetime(curr_date)
+            store_path = get_yfin_store_path(symbol)
+            store = load_yfin_history(symbol)
+            if store is None:
+                raise Exception(f"Stockstats fail: no Yahoo Finance data for {symbol}")
+            source = (store_path, store.mtime)
+
+        if memoize:
+            with _stock_frames_lock:
+                df = _stock_frames.get(source)
+                if df is not None:
+                    _stock_frames.move_to_end(source)
+                    return df
 
-            end_date = today_date
-            start_date = today_date - pd.DateOffset(years=15)
-            start_date = start_date.strftime("%Y-%m-%d")
-            end_date = end_date.strftime("%Y-%m-%d")
+        if store is not None:
+            df = wrap(store.slice())
+        else:
+            try:
+                data = pd.read_csv(source)
+            except FileNotFoundError:
+                raise Exception("Stockstats fail: Yahoo Finance data not fetched yet!")
+            df = wrap(data)
+            df["Date"] = df["Date"].astype(str).str[:10]
 
-            # Get config and ensure cache directory exists
-            os.makedirs(config["data_cache_dir"], exist_ok=True)
+        if not memoize:
+            return df
 
-            data_file = os.path.join(
-                config["data_cache_dir"],
-                f"{symbol}-YFin-data-{start_date}-{end_date}.csv",
-            )
+        max_frames = config.get("stockstats_frame_cache_size", 8)
+        with _stock_frames_lock:
+            # A refreshed store replaces the frame loaded from its previous version
+            if isinstance(source, tuple):
+                for key in [k for k in _stock_frames if isinstance(k, tuple) and k[0] == source[0]]:
+                    del _stock_frames[key]
+            _stock_frames[source] = df
+            while len(_stock_frames) > max(0, max_frames):
+                _stock_frames.popitem(last=False)
+        return df
 
-            if os.path.exists(data_file):
-                data = pd.read_csv(data_file)
-                data["Date"] = pd.to_datetime(data["Date"])
-            else:
-                data = yf.download(
-                    symbol,
-                    start=start_date,
-                    end=end_date,
-                    multi_level_index=False,
-                    progress=False,
-                    auto_adjust=True,
-                )
-                data = data.reset_index()
-                data.to_csv(data_file, index=False)
+    @staticmethod
+    def get_stock_stats_window(
+        symbol: Annotated[str, "ticker symbol for the company"],
+        indicator: Annotated[
+            str, "quantitative indicators based off of the stock data for the company"
+        ],
+        start_date: Annotated[str, "start date of the window, YYYY-mm-dd"],
+        end_date: Annotated[str, "end date of the window, YYYY-mm-dd"],
+    ) -> pd.Series:
+        """Compute indicator once and return its values for the trading days in the window.
 
-            df = wrap(data)
-            df["Date"] = df["Date"].dt.strftime("%Y-%m-%d")
-            curr_date = curr_date.strftime("%Y-%m-%d")
+        Returns:
+            pd.Series: indicator values indexed by YYYY-mm-dd date strings, in ascending order
+        """
+        df = StockstatsUtils.get_stock_data(symbol)
+        with _indicator_lock:
+            values = df[indicator]  # trigger stockstats to calculate the indicator
+        dates = df["Date"]
+        mask = (dates >= start_date) & (dates <= end_date)
+        return pd.Series(values[mask].values, index=dates[mask].values, name=indicator)
 
-        df[indicator]  # trigger stockstats to calculate the indicator
-        matching_rows = df[df["Date"].str.startswith(curr_date)]
+    @staticmethod
+    def get_stock_stats(
+        symbol: Annotated[str, "ticker symbol for the company"],
+        indicator: Annotated[
+            str, "quantitative indicators based off of the stock data for the company"
+        ],
+        curr_date: Annotated[
+            str, "curr date for retrieving stock price data, YYYY-mm-dd"
+        ],
+    ):
+        curr_date = pd.to_datetime(curr_date).strftime("%Y-%m-%d")
+        matching_rows = StockstatsUtils.get_stock_stats_window(
+            symbol, indicator, curr_date, curr_date
+        )
 
         if not matching_rows.empty:
-            indicator_value = matching_rows[indicator].values[0]
+            indicator_value = matching_rows.values[0]
             return indicator_value
         else:
             return "N/A: Not a trading day (weekend or holiday)"
@@ -0,0 +1,214 @@
+import os
+import re
+import json
+import time
+import pickle
+import sqlite3
+import hashlib
+import threading
+from collections import defaultdict
+from datetime import date, timedelta
+from typing import Annotated, Any, Dict, Optional, Tuple
+
+from .config import get_config
+
+# Bump when the key or value format changes so stale entries are ignored
+CACHE_FORMAT_VERSION = 2
+
+_DATE_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
+_cache: Optional["VendorCache"] = None
+_cache_lock = threading.Lock()
+
+
+def is_historical_call(args, kwargs) -> bool:
+    """Whether a call only concerns dates whose data can no longer change.
+
+    A call is historical when it has date arguments and all of them are at least
+    two days old, leaving a day of slack for late vendor updates and timezones.
+    """
+    dates = [
+        value
+        for value in list(args) + list(kwargs.values())
+        if isinstance(value, str) and _DATE_PATTERN.match(value)
+    ]
+    if not dates:
+        return False
+    return max(dates) < (date.today() - timedelta(days=1)).strftime("%Y-%m-%d")
+
+
+class ErrorResult(str):
+    """Error text a vendor returns to the agent instead of raising.
+
+    The agent still sees the message, but the vendor cache never stores it, so
+    a transient failure does not become the permanent answer for a call.
+    """
+
+
+def is_cacheable(result) -> bool:
+    """Skip empty results and vendor error text."""
+    if result is None or isinstance(result, ErrorResult):
+        return False
+    if isinstance(result, str):
+        return bool(result.strip()) and not result.startswith("Error")
+    return True
+
+
+class VendorCache:
+    """Content-addressed SQLite cache of vendor responses with TTLs and LRU eviction."""
+
+    def __init__(self, path: str, max_size_mb: float, ttl_seconds: Dict[str, Optional[float]]):
+        self.path = path
+        self.max_bytes = int(max_size_mb * 1024 * 1024)
+        self.ttl_seconds = ttl_seconds
+        self.hits = defaultdict(int)
+        self.misses = defaultdict(int)
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS entries (
+                key TEXT PRIMARY KEY,
+                method TEXT NOT NULL,
+                category TEXT NOT NULL,
+                value BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                created REAL NOT NULL,
+                expires REAL,
+                last_access REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS entries_last_access ON entries (last_access)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS entries_expires ON entries (expires)"
+        )
+        # Running total of stored bytes, so puts do not sum the whole table
+        self._total_bytes = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM entries"
+        ).fetchone()[0]
+
+    @staticmethod
+    def make_key(method: str, vendor_config: str, args, kwargs) -> str:
+        payload = json.dumps(
+            [CACHE_FORMAT_VERSION, method, vendor_config, list(args), kwargs],
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str, category: str) -> Tuple[bool, Any]:
+        """Look up key. Returns (hit, value)."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires, size FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or (row[1] is not None and row[1] <= now):
+                if row is not None:
+                    self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                    self._total_bytes -= row[2]
+                self.misses[category] += 1
+                return False, None
+            self._conn.execute(
+                "UPDATE entries SET last_access = ? WHERE key = ?", (now, key)
+            )
+            self.hits[category] += 1
+        return True, pickle.loads(row[0])
+
+    def put(self, key: str, method: str, category: str, value: Any, historical: bool) -> None:
+        if not is_cacheable(value):
+            return
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        now = time.time()
+        # A method's own TTL takes precedence over its category's
+        ttl = None if historical else self.ttl_seconds.get(method, self.ttl_seconds.get(category))
+        expires = None if ttl is None else now + ttl
+        with self._lock:
+            old = self._conn.execute(
+                "SELECT size FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, method, category, blob, len(blob), now, expires, now),
+            )
+            self._total_bytes += len(blob) - (old[0] if old else 0)
+            if self._total_bytes > self.max_bytes:
+                self._evict(now)
+
+    def _evict(self, now: float) -> None:
+        """Drop expired entries, then least recently used ones until under the size bound."""
+        expired = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM entries WHERE expires IS NOT NULL AND expires <= ?",
+            (now,),
+        ).fetchone()[0]
+        if expired:
+            self._conn.execute(
+                "DELETE FROM entries WHERE expires IS NOT NULL AND expires <= ?", (now,)
+            )
+            self._total_bytes -= expired
+        if self._total_bytes <= self.max_bytes:
+            return
+        for key, size in self._conn.execute(
+            "SELECT key, size FROM entries ORDER BY last_access"
+        ).fetchall():
+            self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+            self._total_bytes -= size
+            if self._total_bytes <= self.max_bytes:
+                break
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM entries")
+            self._total_bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            entries, size = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries"
+            ).fetchone()
+            categories = set(self.hits) | set(self.misses)
+            return {
+                "entries": entries,
+                "size_bytes": size,
+                "hits": sum(self.hits.values()),
+                "misses": sum(self.misses.values()),
+                "by_category": {
+                    category: {"hits": self.hits[category], "misses": self.misses[category]}
+                    for category in sorted(categories)
+                },
+            }
+
+
+def get_vendor_cache() -> Optional[VendorCache]:
+    """Return the process-wide vendor cache, or None when it is disabled."""
+    global _cache
+    cache_config = get_config().get("vendor_cache", {})
+    if not cache_config.get("enabled", False):
+        return None
+
+    path = cache_config.get("path") or os.path.join(
+        get_config()["data_cache_dir"], "vendor_cache.sqlite"
+    )
+    with _cache_lock:
+        if _cache is None or _cache.path != path:
+            _cache = VendorCache(
+                path,
+                cache_config.get("max_size_mb", 512),
+                cache_config.get("ttl_seconds", {}),
+            )
+        else:
+            _cache.max_bytes = int(cache_config.get("max_size_mb", 512) * 1024 * 1024)
+            _cache.ttl_seconds = cache_config.get("ttl_seconds", {})
+        return _cache
+
+
+def get_vendor_cache_stats() -> Annotated[Optional[dict], "hit/miss counters and size of the cache"]:
+    """Hit/miss counters (overall and per data category) and size of the vendor cache."""
+    cache = get_vendor_cache()
+    return cache.stats() if cache is not None else None
@@ -0,0 +1,181 @@
+import time
+import socket
+import threading
+from collections import deque
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from typing import Annotated, Dict, List, Optional, Tuple
+
+import numpy as np
+import requests
+
+from .config import get_config
+from .alpha_vantage_common import AlphaVantageRateLimitError
+
+# Rolling health of every (method, vendor) pair as seen by route_to_vendor.
+# With the breaker enabled, a vendor whose calls keep failing at the transport
+# level (connection errors, timeouts, rate limits) has its circuit opened: it
+# is skipped until cooldown_seconds have passed, then a single trial call is
+# let through (half-open) and its outcome closes or re-opens the circuit.
+# Failures such as missing data for a ticker never count toward the circuit.
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+TRANSIENT_ERRORS = (
+    AlphaVantageRateLimitError,
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+    ConnectionError,
+    socket.timeout,
+    TimeoutError,
+    FuturesTimeoutError,
+)
+
+_health: Dict[Tuple[str, str], "VendorHealth"] = {}
+_health_lock = threading.Lock()
+
+
+def _settings() -> dict:
+    return get_config().get("vendor_health", {})
+
+
+def is_transient_error(error) -> bool:
+    """Whether a vendor failure says the vendor is unreachable or throttled, not that data is missing."""
+    return isinstance(error, TRANSIENT_ERRORS)
+
+
+class VendorHealth:
+    """Rolling latency/outcome window and circuit breaker state for one (method, vendor)."""
+
+    def __init__(self, window: int):
+        self.latencies = deque(maxlen=window)
+        self.outcomes = deque(maxlen=window)
+        self.calls = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.state = CLOSED
+        self.opened_at = 0.0
+        self.trial_started = None
+
+    def percentile(self, q: float) -> Optional[float]:
+        if not self.latencies:
+            return None
+        return float(np.percentile(np.fromiter(self.latencies, dtype=float), q))
+
+    def error_rate(self) -> Optional[float]:
+        if not self.outcomes:
+            return None
+        return 1.0 - sum(self.outcomes) / len(self.outcomes)
+
+
+def _get_health(method: str, vendor: str) -> VendorHealth:
+    key = (method, vendor)
+    health = _health.get(key)
+    if health is None:
+        health = VendorHealth(_settings().get("window", 50))
+        _health[key] = health
+    return health
+
+
+def allow_call(
+    method: Annotated[str, "vendor method name"],
+    vendor: Annotated[str, "vendor name"],
+) -> bool:
+    """Whether the circuit for (method, vendor) lets a call through right now.
+
+    Call it only when the vendor is about to be tried: in the half-open state
+    a True answer hands out the single trial call.
+    """
+    if not _settings().get("enabled", False):
+        return True
+    cooldown = _settings().get("cooldown_seconds", 60)
+    now = time.monotonic()
+    with _health_lock:
+        health = _get_health(method, vendor)
+        if health.state == CLOSED:
+            return True
+        if health.state == OPEN and now - health.opened_at >= cooldown:
+            health.state = HALF_OPEN
+            health.trial_started = now
+            return True
+        # Let another trial through if the previous one never reported back
+        if health.state == HALF_OPEN and now - health.trial_started >= cooldown:
+            health.trial_started = now
+            return True
+        return False
+
+
+def record_call(
+    method: Annotated[str, "vendor method name"],
+    vendor: Annotated[str, "vendor name"],
+    latency: Annotated[float, "wall time of the call in seconds"],
+    succeeded: Annotated[bool, "whether the vendor produced a result"],
+    transient: Annotated[bool, "whether a failure was a transport, timeout or rate-limit error"] = False,
+) -> None:
+    """Record the outcome of one vendor attempt and update its circuit.
+
+    Only transient failures count toward opening the circuit; any other
+    outcome shows the vendor is reachable and closes it.
+    """
+    threshold = _settings().get("failure_threshold", 3)
+    with _health_lock:
+        health = _get_health(method, vendor)
+        health.calls += 1
+        health.latencies.append(latency)
+        health.outcomes.append(succeeded)
+        if not succeeded:
+            health.failures += 1
+        if succeeded or not transient:
+            health.consecutive_failures = 0
+            health.state = CLOSED
+            return
+
+        health.consecutive_failures += 1
+        if health.state == HALF_OPEN or health.consecutive_failures >= threshold:
+            health.state = OPEN
+            health.opened_at = time.monotonic()
+
+
+def latency_percentile(
+    method: Annotated[str, "vendor method name"],
+    vendor: Annotated[str, "vendor name"],
+    q: Annotated[float, "percentile, 0-100"],
+    min_samples: Annotated[int, "calls needed before a percentile is reported"] = 1,
+) -> Optional[float]:
+    """Observed latency percentile in seconds, or None with fewer than min_samples calls recorded."""
+    with _health_lock:
+        health = _health.get((method, vendor))
+        if health is None or len(health.latencies) < max(1, min_samples):
+            return None
+        return health.percentile(q)
+
+
+def order_by_latency(
+    method: Annotated[str, "vendor method name"],
+    vendors: Annotated[List[str], "vendors in their configured order"],
+) -> List[str]:
+    """Sort vendors by observed p50 latency; vendors without data keep their place after them."""
+    p50 = {vendor: latency_percentile(method, vendor, 50) for vendor in vendors}
+    return sorted(vendors, key=lambda v: (p50[v] is None, p50[v] or 0.0))
+
+
+def get_vendor_stats() -> Annotated[Dict[str, dict], "health stats keyed by 'method/vendor'"]:
+    """Rolling latency, error rate and circuit state of every (method, vendor) seen so far."""
+    with _health_lock:
+        return {
+            f"{method}/{vendor}": {
+                "calls": health.calls,
+                "failures": health.failures,
+                "error_rate": health.error_rate(),
+                "p50_latency": health.percentile(50),
+                "p95_latency": health.percentile(95),
+                "consecutive_failures": health.consecutive_failures,
+                "circuit": health.state,
+            }
+            for (method, vendor), health in sorted(_health.items())
+        }
+
+
+def reset_vendor_stats() -> None:
+    with _health_lock:
+        _health.clear()
@@ -0,0 +1,143 @@
+import json
+import bisect
+import threading
+from typing import Annotated, Dict, Tuple
+
+# Counters and latency histograms for every (method, vendor) pair routed by
+# route_to_vendor, kept in process so batch runs can be exported to dashboards
+# as JSON or in the Prometheus text exposition format.
+COUNTERS = ("calls", "failures", "fallbacks", "timeouts")
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+_COUNTER_HELP = {
+    "calls": "Vendor attempts made by route_to_vendor.",
+    "failures": "Vendor attempts that produced no result.",
+    "fallbacks": "Attempts on a vendor that was not configured as primary.",
+    "timeouts": "Vendor attempts abandoned at their deadline.",
+}
+
+_metrics: Dict[Tuple[str, str], "VendorMetrics"] = {}
+_metrics_lock = threading.Lock()
+
+
+class VendorMetrics:
+    """Counters and a latency histogram for one (method, vendor)."""
+
+    def __init__(self):
+        self.counters = dict.fromkeys(COUNTERS, 0)
+        # One slot per bucket bound plus a final +Inf slot; counts are not cumulative
+        self.bucket_counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.latency_sum = 0.0
+        self.latency_count = 0
+
+    def observe(self, seconds: float) -> None:
+        self.bucket_counts[bisect.bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        self.latency_sum += seconds
+        self.latency_count += 1
+
+    def as_dict(self) -> dict:
+        cumulative, buckets = 0, {}
+        for bound, count in zip(LATENCY_BUCKETS + ("+Inf",), self.bucket_counts):
+            cumulative += count
+            buckets[str(bound)] = cumulative
+        return {
+            **self.counters,
+            "latency": {
+                "count": self.latency_count,
+                "sum": self.latency_sum,
+                "buckets": buckets,
+            },
+        }
+
+
+def _get_metrics(method: str, vendor: str) -> VendorMetrics:
+    key = (method, vendor)
+    metrics = _metrics.get(key)
+    if metrics is None:
+        metrics = VendorMetrics()
+        _metrics[key] = metrics
+    return metrics
+
+
+def increment(
+    method: Annotated[str, "vendor method name"],
+    vendor: Annotated[str, "vendor name"],
+    counter: Annotated[str, "one of COUNTERS"],
+    amount: Annotated[int, "how much to add"] = 1,
+) -> None:
+    with _metrics_lock:
+        _get_metrics(method, vendor).counters[counter] += amount
+
+
+def record_attempt(
+    method: Annotated[str, "vendor method name"],
+    vendor: Annotated[str, "vendor name"],
+    latency: Annotated[float, "wall time of the attempt in seconds"],
+    succeeded: Annotated[bool, "whether the vendor produced a result"],
+) -> None:
+    """Count one vendor attempt and add its latency to the histogram."""
+    with _metrics_lock:
+        metrics = _get_metrics(method, vendor)
+        metrics.counters["calls"] += 1
+        if not succeeded:
+            metrics.counters["failures"] += 1
+        metrics.observe(latency)
+
+
+def get_vendor_metrics() -> Annotated[Dict[str, dict], "metrics keyed by 'method/vendor'"]:
+    """Counters and cumulative latency buckets of every (method, vendor) seen so far."""
+    with _metrics_lock:
+        return {
+            f"{method}/{vendor}": metrics.as_dict()
+            for (method, vendor), metrics in sorted(_metrics.items())
+        }
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def export_prometheus(
+    prefix: Annotated[str, "metric name prefix"] = "tradingagents_vendor",
+) -> str:
+    """Render the registry in the Prometheus text exposition format."""
+    with _metrics_lock:
+        items = [
+            (_escape_label(method), _escape_label(vendor), metrics.as_dict())
+            for (method, vendor), metrics in sorted(_metrics.items())
+        ]
+
+    lines = []
+    for counter in COUNTERS:
+        name = f"{prefix}_{counter}_total"
+        lines.append(f"# HELP {name} {_COUNTER_HELP[counter]}")
+        lines.append(f"# TYPE {name} counter")
+        for method, vendor, data in items:
+            lines.append(f'{name}{{method="{method}",vendor="{vendor}"}} {data[counter]}')
+
+    name = f"{prefix}_latency_seconds"
+    lines.append(f"# HELP {name} Wall time of vendor attempts.")
+    lines.append(f"# TYPE {name} histogram")
+    for method, vendor, data in items:
+        labels = f'method="{method}",vendor="{vendor}"'
+        for bound, count in data["latency"]["buckets"].items():
+            lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {count}')
+        lines.append(f"{name}_sum{{{labels}}} {data['latency']['sum']}")
+        lines.append(f"{name}_count{{{labels}}} {data['latency']['count']}")
+    return "\n".join(lines) + "\n"
+
+
+def export_metrics(
+    fmt: Annotated[str, "'json' or 'prometheus'"] = "json",
+) -> str:
+    """Export the registry as JSON or Prometheus text."""
+    if fmt == "prometheus":
+        return export_prometheus()
+    if fmt == "json":
+        return json.dumps(get_vendor_metrics(), indent=2)
+    raise ValueError(f"Unsupported metrics format '{fmt}', expected 'json' or 'prometheus'")
+
+
+def reset_vendor_metrics() -> None:
+    with _metrics_lock:
+        _metrics.clear()
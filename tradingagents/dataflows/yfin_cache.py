@@ -0,0 +1,149 @@
+import os
+import glob
+import threading
+from datetime import date
+from typing import Annotated, Optional
+
+import pandas as pd
+import yfinance as yf
+
+from .config import get_config
+from .price_store import PriceStore, open_price_store, write_price_store
+
+# One price store per symbol holds the adjusted daily bars (with dividends and
+# splits) shared by the stockstats indicators and get_YFin_data_online. It is
+# topped up with only the missing bars; since a dividend or split rewrites the
+# adjusted history, one showing up in the new bars triggers a full refetch.
+HISTORY_YEARS = 15
+YFIN_COLUMNS = ["Open", "High", "Low", "Close", "Volume", "Dividends", "Stock Splits"]
+
+_symbol_locks = {}
+_symbol_locks_lock = threading.Lock()
+
+
+def _get_symbol_lock(symbol: str) -> threading.Lock:
+    with _symbol_locks_lock:
+        return _symbol_locks.setdefault(symbol, threading.Lock())
+
+
+def get_yfin_store_path(symbol: Annotated[str, "ticker symbol of the company"]) -> str:
+    return os.path.join(get_config()["data_cache_dir"], "yfinance", symbol.upper())
+
+
+def get_history_start() -> str:
+    return (pd.Timestamp.today() - pd.DateOffset(years=HISTORY_YEARS)).strftime("%Y-%m-%d")
+
+
+def get_download_end() -> str:
+    """Exclusive end date that includes today's bar."""
+    return (pd.Timestamp.today() + pd.Timedelta(days=1)).strftime("%Y-%m-%d")
+
+
+def _download(symbol: str, start_date: str) -> pd.DataFrame:
+    return yf.download(
+        symbol,
+        start=start_date,
+        end=get_download_end(),
+        multi_level_index=False,
+        progress=False,
+        auto_adjust=True,
+        actions=True,
+    )
+
+
+def _has_corporate_actions(data: pd.DataFrame) -> bool:
+    dividends = data.get("Dividends", pd.Series(dtype=float)).fillna(0)
+    splits = data.get("Stock Splits", pd.Series(dtype=float)).fillna(0)
+    return bool((dividends != 0).any() or (splits != 0).any())
+
+
+def _remove_stale_csvs(symbol: str) -> None:
+    """Delete the per-day CSV files the previous cache layout left behind."""
+    pattern = os.path.join(get_config()["data_cache_dir"], f"{symbol}-YFin-data-*.csv")
+    for path in glob.glob(pattern):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def store_yfin_history(
+    symbol: Annotated[str, "ticker symbol of the company"],
+    data: Annotated[pd.DataFrame, "daily bars indexed by date, as returned by yf.download"],
+    history_start: Annotated[str, "first date the data was requested from, yyyy-mm-dd"],
+) -> Optional[PriceStore]:
+    """Write downloaded bars as the symbol's store, replacing any existing one."""
+    if data is None or data.empty:
+        return None
+
+    data = data[[column for column in YFIN_COLUMNS if column in data.columns]].copy()
+    data.index.name = "Date"
+    write_price_store(
+        get_yfin_store_path(symbol),
+        data.reset_index(),
+        extra_meta={"history_start": history_start, "refreshed_on": date.today().isoformat()},
+    )
+    _remove_stale_csvs(symbol)
+    return open_price_store(get_yfin_store_path(symbol))
+
+
+def append_yfin_bars(
+    symbol: Annotated[str, "ticker symbol of the company"],
+    store: Annotated[PriceStore, "the symbol's current store"],
+    recent: Annotated[pd.DataFrame, "bars downloaded from the store's last date on"],
+) -> Optional[PriceStore]:
+    """Append recent bars to the symbol's store.
+
+    Returns None, leaving the store untouched, when the new bars include a
+    dividend or split and the full history has to be downloaded again.
+    """
+    recent = recent[[c for c in YFIN_COLUMNS if c in recent.columns]].copy()
+    new_bars = recent[recent.index.strftime("%Y-%m-%d") > store.last_date]
+    if _has_corporate_actions(new_bars):
+        return None
+
+    recent.index.name = "Date"
+    path = get_yfin_store_path(symbol)
+    write_price_store(
+        path,
+        pd.concat([store.slice(), recent.reset_index()], ignore_index=True),
+        extra_meta={
+            "history_start": store.meta.get("history_start", store.first_date),
+            "refreshed_on": date.today().isoformat(),
+        },
+    )
+    return open_price_store(path)
+
+
+def load_yfin_history(
+    symbol: Annotated[str, "ticker symbol of the company"],
+    end_date: Annotated[Optional[str], "latest date needed, yyyy-mm-dd; None for up to today"] = None,
+) -> Optional[PriceStore]:
+    """Return the symbol's cached daily bars, fetching only what is missing.
+
+    The store is refreshed at most once a day, and not at all when it already
+    covers end_date. Returns None when yfinance has no data for the symbol.
+    """
+    symbol = symbol.upper()
+    path = get_yfin_store_path(symbol)
+    today = date.today().isoformat()
+
+    with _get_symbol_lock(symbol):
+        store = open_price_store(path)
+        if store is not None and (
+            store.meta.get("refreshed_on") == today
+            or (end_date is not None and end_date <= store.last_date)
+        ):
+            return store
+
+        if store is not None:
+            # Refetch from the last stored bar, which may have been partial
+            recent = _download(symbol, store.last_date)
+            if recent.empty:
+                return store
+            merged = append_yfin_bars(symbol, store, recent)
+            if merged is not None:
+                return merged
+
+        history_start = get_history_start()
+        return store_yfin_history(symbol, _download(symbol, history_start), history_start)
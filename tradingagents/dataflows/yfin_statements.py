@@ -0,0 +1,147 @@
+import os
+import time
+import pickle
+import threading
+from datetime import datetime
+from typing import Annotated, Any, Dict, Iterable, Optional
+
+import yfinance as yf
+
+from .config import get_config
+
+# All of a ticker's yfinance statements are fetched together into one bundle,
+# kept in process and on disk for yfinance_statements_ttl_seconds, so the
+# fundamentals analyst's back-to-back statement calls share a single fetch.
+# A statement that failed to fetch keeps its error for
+# yfinance_statements_retry_seconds, then is fetched again on its own.
+STATEMENT_ATTRIBUTES = {
+    ("balance_sheet", "annual"): "balance_sheet",
+    ("balance_sheet", "quarterly"): "quarterly_balance_sheet",
+    ("cashflow", "annual"): "cashflow",
+    ("cashflow", "quarterly"): "quarterly_cashflow",
+    ("income_stmt", "annual"): "income_stmt",
+    ("income_stmt", "quarterly"): "quarterly_income_stmt",
+    ("insider_transactions", None): "insider_transactions",
+}
+
+_bundles: Dict[str, dict] = {}
+_bundles_lock = threading.Lock()
+_ticker_locks: Dict[str, threading.Lock] = {}
+
+
+def _get_ticker_lock(ticker: str) -> threading.Lock:
+    with _bundles_lock:
+        return _ticker_locks.setdefault(ticker, threading.Lock())
+
+
+def _bundle_path(ticker: str) -> str:
+    return os.path.join(get_config()["data_cache_dir"], "yfinance_statements", f"{ticker}.pkl")
+
+
+def _is_fresh(bundle: dict) -> bool:
+    ttl = get_config().get("yfinance_statements_ttl_seconds", 24 * 3600)
+    return time.time() - bundle["fetched_at"] < ttl
+
+
+def _fetch_statements(ticker: str, keys: Iterable) -> tuple:
+    """Fetch the given statements, returning (statements, failed) with failure times."""
+    ticker_obj = yf.Ticker(ticker)
+    statements, failed = {}, {}
+    for key in keys:
+        try:
+            statements[key] = getattr(ticker_obj, STATEMENT_ATTRIBUTES[key])
+        except Exception as e:
+            # Kept so the caller for this statement reports the error
+            statements[key] = e
+            failed[key] = time.time()
+    return statements, failed
+
+
+def _fetch_bundle(ticker: str) -> dict:
+    statements, failed = _fetch_statements(ticker, STATEMENT_ATTRIBUTES)
+    return {
+        "fetched_at": time.time(),
+        "retrieved_on": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "statements": statements,
+        "failed": failed,
+    }
+
+
+def _retry_failed(ticker: str, bundle: dict) -> Optional[dict]:
+    """Refetch the statements that failed long enough ago, or return None if none are due."""
+    retry_after = get_config().get("yfinance_statements_retry_seconds", 300)
+    failed = bundle.get("failed", {})
+    due = [key for key, failed_at in failed.items() if time.time() - failed_at >= retry_after]
+    if not due:
+        return None
+    statements, still_failed = _fetch_statements(ticker, due)
+    return {
+        **bundle,
+        "statements": {**bundle["statements"], **statements},
+        "failed": {**{k: v for k, v in failed.items() if k not in due}, **still_failed},
+    }
+
+
+def _load_bundle(path: str) -> Optional[dict]:
+    try:
+        with open(path, "rb") as f:
+            return pickle.load(f)
+    except Exception:
+        # Missing, partly written, or holding an error that no longer unpickles
+        return None
+
+
+def _save_bundle(path: str, bundle: dict) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp-{os.getpid()}-{threading.get_ident()}"
+    try:
+        with open(tmp_path, "wb") as f:
+            pickle.dump(bundle, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        # A stored error that cannot be pickled; the bundle stays cached in process
+        os.remove(tmp_path)
+        return
+    os.replace(tmp_path, path)
+
+
+def get_statement_bundle(
+    ticker: Annotated[str, "ticker symbol of the company"],
+) -> dict:
+    """Return every statement for ticker, fetching them all at most once per TTL.
+
+    Statements that failed are cached with their error and retried on their
+    own once yfinance_statements_retry_seconds has passed.
+    """
+    ticker = ticker.upper()
+    with _get_ticker_lock(ticker):
+        path = _bundle_path(ticker)
+        with _bundles_lock:
+            bundle = _bundles.get(ticker)
+        if bundle is None or not _is_fresh(bundle):
+            bundle = _load_bundle(path)
+
+        if bundle is None or not _is_fresh(bundle):
+            bundle = _fetch_bundle(ticker)
+            _save_bundle(path, bundle)
+        else:
+            retried = _retry_failed(ticker, bundle)
+            if retried is not None:
+                bundle = retried
+                _save_bundle(path, bundle)
+
+        with _bundles_lock:
+            _bundles[ticker] = bundle
+        return bundle
+
+
+def get_statement(
+    ticker: Annotated[str, "ticker symbol of the company"],
+    statement: Annotated[str, "balance_sheet, cashflow, income_stmt or insider_transactions"],
+    freq: Annotated[Any, "'annual' or 'quarterly'; None for insider_transactions"] = None,
+):
+    """Return (data, retrieved_on) for one statement, raising if its fetch failed."""
+    bundle = get_statement_bundle(ticker)
+    data = bundle["statements"][(statement, freq)]
+    if isinstance(data, Exception):
+        raise data
+    return data, bundle["retrieved_on"]
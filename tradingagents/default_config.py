@@ -17,6 +17,26 @@ DEFAULT_CONFIG = {
     "max_debate_rounds": 1,
     "max_risk_discuss_rounds": 1,
     "max_recur_limit": 100,
+    # Exact-match cache of LLM responses, for re-running the same historical
+    # windows. Identical prompts return the stored answer instead of sampling.
+    "llm_cache": {
+        "enabled": False,
+        "path": None,  # Defaults to data_cache_dir/llm_cache.sqlite
+        "max_size_mb": 256,  # Least recently used entries are evicted above this size
+    },
+    # Run the selected analysts concurrently instead of one after another.
+    # Keep off for providers with tight concurrency or rate limits.
+    "parallel_analysts": False,
+    # Save graph state after every step so failed runs can be resumed with
+    # TradingAgentsGraph.resume(); requires langgraph-checkpoint-sqlite
+    "checkpointing": {
+        "enabled": False,
+        "path": None,  # Defaults to data_cache_dir/checkpoints.sqlite
+        "keep_completed": False,  # Keep checkpoints of runs that finished
+    },
+    # Tool calls from one analyst turn run concurrently on a bounded pool
+    "tool_concurrency": 4,
+    "tool_timeout": 300,  # Seconds per tool call; None for no limit
     # Data vendor configuration
     # Category-level configuration (default for all tools in category)
     "data_vendors": {
@@ -30,4 +50,64 @@ DEFAULT_CONFIG = {
         # Example: "get_stock_data": "alpha_vantage",  # Override category default
         # Example: "get_news": "openai",               # Override category default
     },
+    # Vendor execution settings
+    "parallel_vendor_calls": False,  # Run independent vendor implementations concurrently
+    "vendor_max_workers": 8,         # Size of the shared vendor call thread pool
+    "vendor_concurrency_limits": {   # Max in-flight calls per upstream service (vendor name or IMPL_SERVICES entry)
+        "default": 4,
+        "google": 1,
+    },
+    "vendor_health": {
+        "enabled": False,                        # Skip vendors whose circuit is open
+        "window": 50,                            # Calls kept per (method, vendor) for latency/error stats
+        "failure_threshold": 3,                  # Consecutive transport/timeout/rate-limit failures that open a circuit
+        "cooldown_seconds": 60,                  # Time before a trial call is let through again
+        "reorder_fallbacks_by_latency": False,   # Try faster fallback vendors first
+    },
+    "http_timeout_seconds": 30,                  # Timeout for each vendor HTTP request
+    "vendor_deadlines": {                        # Seconds a vendor attempt may take before falling back
+        "default": 120,
+        "get_news": 180,
+        "get_global_news": 180,
+    },
+    "vendor_hedging": {
+        "enabled": False,     # Start the next fallback when the current vendor is slower than its p95
+        "min_samples": 5,     # Calls observed before a vendor's p95 is trusted
+        "min_delay": 0.5,     # Never hedge earlier than this many seconds
+    },
+    "alpha_vantage_requests_per_minute": None,  # Set to your plan's quota (e.g. 5 on the free tier) to pace requests
+    "alpha_vantage_burst": 1,                # Requests that may be sent back to back
+    "yfinance_statements_ttl_seconds": 24 * 3600,  # How long a ticker's fetched statements are reused
+    "yfinance_statements_retry_seconds": 300,  # How long a statement that failed to fetch keeps its error
+    "stockstats_frame_cache_size": 8,  # Symbols whose price frames stay in memory for indicators
+    # Google News scraping
+    "google_news": {
+        "max_concurrency": 3,          # Result pages fetched at once
+        "min_delay": 1.0,              # Random gap between request starts, in seconds
+        "max_delay": 3.0,
+        "max_pages": None,             # None follows pagination to the end
+        "cache_ttl_seconds": 3600,     # Windows ending before yesterday are cached for good
+    },
+    # Compact rendering of tool outputs passed to the LLM
+    "tool_output_budget": {
+        "enabled": True,
+        "max_tokens": 3000,             # Approximate budget per tool result
+        "max_price_rows": 30,           # Longer price windows are summarized and sampled
+        "max_news_items": 15,
+        "max_news_summary_chars": 300,
+    },
+    # Persistent vendor response cache
+    "vendor_cache": {
+        "enabled": False,
+        "path": None,         # Defaults to data_cache_dir/vendor_cache.sqlite
+        "max_size_mb": 512,   # Least recently used entries are evicted above this size
+        "ttl_seconds": {      # Per data category; calls on past dates never expire
+            "core_stock_apis": 24 * 3600,
+            "technical_indicators": 24 * 3600,
+            "fundamental_data": 90 * 24 * 3600,
+            "news_data": 3600,
+            # Methods can override their category; insider filings change at most daily
+            "get_insider_transactions": 24 * 3600,
+        },
+    },
 }
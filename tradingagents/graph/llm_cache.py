@@ -0,0 +1,228 @@
+# TradingAgents/graph/llm_cache.py
+
+import os
+import re
+import json
+import time
+import pickle
+import sqlite3
+import hashlib
+import threading
+from collections import defaultdict
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+from langchain_core.caches import BaseCache
+from langchain_core.outputs import Generation
+
+# Bump when the key or value format changes so stale entries are ignored
+CACHE_FORMAT_VERSION = 1
+
+# Message fields that differ between otherwise identical runs
+_VOLATILE_MESSAGE_FIELDS = ("id", "response_metadata", "usage_metadata")
+# Tool output lines stamped with the time of the call rather than the data's date
+_VOLATILE_LINE_PATTERN = re.compile(r"^# Data retrieved on: .*$", re.MULTILINE)
+
+_PROVIDER_PATTERN = re.compile(r"\('_type', '([^']*)'\)")
+_MODEL_PATTERN = re.compile(r"\('model(?:_name)?', '([^']*)'\)|\"model(?:_name)?\": \"([^\"]*)\"")
+
+
+def _normalize_content(content):
+    """Blank out wall-clock stamps in message text, e.g. the retrieval time of tool outputs."""
+    if isinstance(content, str):
+        return _VOLATILE_LINE_PATTERN.sub("# Data retrieved on: <time>", content)
+    if isinstance(content, list):
+        return [
+            {**block, "text": _normalize_content(block["text"])}
+            if isinstance(block, dict) and isinstance(block.get("text"), str)
+            else _normalize_content(block)
+            for block in content
+        ]
+    return content
+
+
+def _normalize_message(message: dict, call_ids: Dict[str, str]) -> dict:
+    """Drop run-specific fields and timestamps from a serialized message and rename tool call ids by position."""
+
+    def alias(call_id):
+        if not isinstance(call_id, str):
+            return call_id
+        return call_ids.setdefault(call_id, f"call_{len(call_ids)}")
+
+    kwargs = {
+        k: v for k, v in message.get("kwargs", {}).items()
+        if k not in _VOLATILE_MESSAGE_FIELDS
+    }
+    for field in ("tool_calls", "invalid_tool_calls"):
+        if isinstance(kwargs.get(field), list):
+            kwargs[field] = [{**call, "id": alias(call.get("id"))} for call in kwargs[field]]
+    additional = kwargs.get("additional_kwargs")
+    if isinstance(additional, dict) and isinstance(additional.get("tool_calls"), list):
+        kwargs["additional_kwargs"] = {
+            **additional,
+            "tool_calls": [
+                {**call, "id": alias(call.get("id"))} for call in additional["tool_calls"]
+            ],
+        }
+    if "tool_call_id" in kwargs:
+        kwargs["tool_call_id"] = alias(kwargs["tool_call_id"])
+    if "content" in kwargs:
+        kwargs["content"] = _normalize_content(kwargs["content"])
+    return {**message, "kwargs": kwargs}
+
+
+def normalize_prompt(prompt: str) -> str:
+    """Canonical form of a serialized chat prompt, stable across otherwise identical runs."""
+    try:
+        messages = json.loads(prompt)
+    except ValueError:
+        return prompt
+    if not isinstance(messages, list):
+        return prompt
+
+    call_ids: Dict[str, str] = {}
+    normalized = [
+        _normalize_message(message, call_ids)
+        if isinstance(message, dict) and "kwargs" in message
+        else message
+        for message in messages
+    ]
+    return json.dumps(normalized, sort_keys=True)
+
+
+def _describe_llm(llm_string: str) -> Tuple[str, str]:
+    """Best-effort (provider, model) from a LangChain llm_string, for stats only."""
+    provider = _PROVIDER_PATTERN.search(llm_string)
+    model = _MODEL_PATTERN.search(llm_string)
+    return (
+        provider.group(1) if provider else "unknown",
+        next((g for g in model.groups() if g), "unknown") if model else "unknown",
+    )
+
+
+def _current_node() -> str:
+    """Name of the graph node making the LLM call, if called from inside the graph."""
+    try:
+        from langgraph.config import get_config as get_run_config
+
+        return get_run_config().get("metadata", {}).get("langgraph_node", "unknown")
+    except Exception:
+        return "unknown"
+
+
+class SQLiteLLMCache(BaseCache):
+    """Exact-match SQLite cache of LLM responses with size-bounded LRU eviction.
+
+    Entries are keyed by the model's llm_string (provider, model, parameters
+    and bound tool schemas) and a hash of the normalized prompt, so reruns of
+    the same (ticker, date) only reach the provider for nodes whose prompts
+    changed. Hits and misses are counted per graph node.
+    """
+
+    def __init__(self, path: str, max_size_mb: float = 256):
+        self.path = path
+        self.max_bytes = int(max_size_mb * 1024 * 1024)
+        self.hits = defaultdict(int)
+        self.misses = defaultdict(int)
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS llm_entries (
+                key TEXT PRIMARY KEY,
+                provider TEXT NOT NULL,
+                model TEXT NOT NULL,
+                node TEXT NOT NULL,
+                value BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                created REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS llm_entries_last_access ON llm_entries (last_access)"
+        )
+        # Running total of stored bytes, so updates do not sum the whole table
+        self._total_bytes = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM llm_entries"
+        ).fetchone()[0]
+
+    @staticmethod
+    def make_key(prompt: str, llm_string: str) -> str:
+        payload = json.dumps([CACHE_FORMAT_VERSION, llm_string, normalize_prompt(prompt)])
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def lookup(self, prompt: str, llm_string: str) -> Optional[Sequence[Generation]]:
+        key = self.make_key(prompt, llm_string)
+        node = _current_node()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM llm_entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses[node] += 1
+                return None
+            self._conn.execute(
+                "UPDATE llm_entries SET last_access = ? WHERE key = ?", (time.time(), key)
+            )
+            self.hits[node] += 1
+        return pickle.loads(row[0])
+
+    def update(self, prompt: str, llm_string: str, return_val: Sequence[Generation]) -> None:
+        key = self.make_key(prompt, llm_string)
+        provider, model = _describe_llm(llm_string)
+        value = pickle.dumps(list(return_val), protocol=pickle.HIGHEST_PROTOCOL)
+        now = time.time()
+        with self._lock:
+            old = self._conn.execute(
+                "SELECT size FROM llm_entries WHERE key = ?", (key,)
+            ).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_entries VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, provider, model, _current_node(), value, len(value), now, now),
+            )
+            self._total_bytes += len(value) - (old[0] if old else 0)
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until the cache is under its size bound."""
+        for key, size in self._conn.execute(
+            "SELECT key, size FROM llm_entries ORDER BY last_access"
+        ).fetchall():
+            self._conn.execute("DELETE FROM llm_entries WHERE key = ?", (key,))
+            self._total_bytes -= size
+            if self._total_bytes <= self.max_bytes:
+                break
+
+    def clear(self, **kwargs: Any) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM llm_entries")
+            self._total_bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Entry count, size and hit rates overall and per graph node."""
+        with self._lock:
+            entries, size = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM llm_entries"
+            ).fetchone()
+            nodes = set(self.hits) | set(self.misses)
+            hits, misses = sum(self.hits.values()), sum(self.misses.values())
+            return {
+                "entries": entries,
+                "size_bytes": size,
+                "hits": hits,
+                "misses": misses,
+                "hit_rate": hits / (hits + misses) if hits + misses else None,
+                "by_node": {
+                    node: {
+                        "hits": self.hits[node],
+                        "misses": self.misses[node],
+                        "hit_rate": self.hits[node] / (self.hits[node] + self.misses[node]),
+                    }
+                    for node in sorted(nodes)
+                },
+            }
@@ -0,0 +1,151 @@
+# TradingAgents/graph/tool_node.py
+
+import asyncio
+import time
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Dict, List, Optional
+
+from langchain_core.messages import ToolMessage
+from langchain_core.runnables import RunnableConfig, RunnableLambda
+from langchain_core.tools import BaseTool
+
+
+class ConcurrentToolNode(RunnableLambda):
+    """Runs the tool calls of the last AI message concurrently.
+
+    Analysts often request several independent tools in one turn (e.g. a batch
+    of get_indicators calls). At most `max_workers` run at once, on a thread
+    pool or as tasks when the graph is invoked asynchronously, and each is
+    limited to `timeout` seconds counted from when it starts running, so calls
+    waiting for a free slot are not charged for the wait. ToolMessages are
+    returned in the order of the message's tool_calls regardless of which call
+    finishes first.
+
+    Python threads cannot be interrupted, so a timed-out call keeps running in
+    the background until its tool returns. It no longer counts against
+    `max_workers`: the sync path retires the pool holding it and later calls
+    get fresh workers, and the async path releases its slot on cancellation.
+    """
+
+    def __init__(
+        self,
+        tools: List[BaseTool],
+        max_workers: int = 4,
+        timeout: Optional[float] = None,
+        name: str = "tools",
+    ):
+        self.tools_by_name: Dict[str, BaseTool] = {tool.name: tool for tool in tools}
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        super().__init__(self._run, afunc=self._arun, name=name)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="tool"
+                )
+            return self._executor
+
+    def _retire_executor(self, executor: ThreadPoolExecutor) -> None:
+        """Stop handing work to a pool whose worker is stuck on a timed-out call."""
+        with self._executor_lock:
+            if self._executor is executor:
+                self._executor = None
+        executor.shutdown(wait=False)
+
+    @staticmethod
+    def _tool_calls(state: Dict[str, Any]) -> list:
+        return state["messages"][-1].tool_calls
+
+    @staticmethod
+    def _error_message(call: dict, error: str) -> ToolMessage:
+        return ToolMessage(
+            content=f"Error: {error}\n Please fix your mistakes.",
+            name=call["name"],
+            tool_call_id=call["id"],
+            status="error",
+        )
+
+    def _run_one(self, call: dict, config: RunnableConfig) -> ToolMessage:
+        tool = self.tools_by_name.get(call["name"])
+        if tool is None:
+            return self._error_message(call, f"{call['name']} is not a valid tool")
+        try:
+            return tool.invoke({**call, "type": "tool_call"}, config)
+        except Exception as e:
+            return self._error_message(call, repr(e))
+
+    async def _arun_one(self, call: dict, config: RunnableConfig) -> ToolMessage:
+        tool = self.tools_by_name.get(call["name"])
+        if tool is None:
+            return self._error_message(call, f"{call['name']} is not a valid tool")
+        try:
+            return await asyncio.wait_for(
+                tool.ainvoke({**call, "type": "tool_call"}, config), self.timeout
+            )
+        except asyncio.TimeoutError:
+            return self._error_message(call, f"{call['name']} timed out after {self.timeout}s")
+        except Exception as e:
+            return self._error_message(call, repr(e))
+
+    def _run(self, state: Dict[str, Any], config: RunnableConfig) -> Dict[str, list]:
+        calls = self._tool_calls(state)
+        if len(calls) == 1 and self.timeout is None:
+            return {"messages": [self._run_one(calls[0], config)]}
+
+        # Submit no more than max_workers calls at a time, so each one starts
+        # running as soon as it is submitted and its clock starts there
+        messages: List[Optional[ToolMessage]] = [None] * len(calls)
+        pending = list(enumerate(calls))[::-1]
+        running = {}  # future -> (index, executor, started)
+        while pending or running:
+            while pending and len(running) < self.max_workers:
+                index, call = pending.pop()
+                executor = self._get_executor()
+                future = executor.submit(self._run_one, call, config)
+                running[future] = (index, executor, time.monotonic())
+
+            remaining = (
+                None
+                if self.timeout is None
+                else max(
+                    0.0,
+                    min(started for _, _, started in running.values())
+                    + self.timeout
+                    - time.monotonic(),
+                )
+            )
+            done, _ = wait(running, timeout=remaining, return_when=FIRST_COMPLETED)
+            for future in done:
+                index, _, _ = running.pop(future)
+                messages[index] = future.result()
+
+            if self.timeout is None:
+                continue
+            now = time.monotonic()
+            for future, (index, executor, started) in list(running.items()):
+                if now - started >= self.timeout:
+                    # The call keeps running on its worker; its result is discarded
+                    del running[future]
+                    self._retire_executor(executor)
+                    call = calls[index]
+                    messages[index] = self._error_message(
+                        call, f"{call['name']} timed out after {self.timeout}s"
+                    )
+        return {"messages": messages}
+
+    async def _arun(self, state: Dict[str, Any], config: RunnableConfig) -> Dict[str, list]:
+        calls = self._tool_calls(state)
+        semaphore = asyncio.Semaphore(self.max_workers)
+
+        # The timeout in _arun_one starts once a slot is acquired, as in _run
+        async def bounded(call):
+            async with semaphore:
+                return await self._arun_one(call, config)
+
+        messages = await asyncio.gather(*(bounded(call) for call in calls))
+        return {"messages": list(messages)}
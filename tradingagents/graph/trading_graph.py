@@ -1,17 +1,18 @@
 # TradingAgents/graph/trading_graph.py
 
 import os
+import asyncio
+import hashlib
+import sqlite3
 from pathlib import Path
 import json
 from datetime import date
-from typing import Dict, Any, Tuple, List, Optional
+from typing import Dict, Any, Tuple, List, Optional, NamedTuple, Iterable, AsyncIterator, Iterator
 
 from langchain_openai import ChatOpenAI
 from langchain_anthropic import ChatAnthropic
 from langchain_google_genai import ChatGoogleGenerativeAI
 
-from langgraph.prebuilt import ToolNode
-
 from tradingagents.agents import *
 from tradingagents.default_config import DEFAULT_CONFIG
 from tradingagents.agents.utils.memory import FinancialSituationMemory
@@ -41,6 +42,18 @@ from .setup import GraphSetup
 from .propagation import Propagator
 from .reflection import Reflector
 from .signal_processing import SignalProcessor
+from .tool_node import ConcurrentToolNode
+from .llm_cache import SQLiteLLMCache
+
+
+class PropagationResult(NamedTuple):
+    """Outcome of one (ticker, date) job run by propagate_many."""
+
+    ticker: str
+    trade_date: str
+    final_state: Optional[Dict[str, Any]]
+    decision: Optional[str]
+    error: Optional[BaseException] = None
 
 
 class TradingAgentsGraph:
@@ -61,6 +74,7 @@ class TradingAgentsGraph:
         """
         self.debug = debug
         self.config = config or DEFAULT_CONFIG
+        self.selected_analysts = list(selected_analysts)
 
         # Update the interface's config
         set_config(self.config)
@@ -71,16 +85,18 @@ class TradingAgentsGraph:
             exist_ok=True,
         )
 
-        # Initialize LLMs
+        # Initialize LLMs, sharing a response cache when enabled
+        self.llm_cache = self._create_llm_cache()
+        llm_kwargs = {"cache": self.llm_cache} if self.llm_cache is not None else {}
         if self.config["llm_provider"].lower() == "openai" or self.config["llm_provider"] == "ollama" or self.config["llm_provider"] == "openrouter":
-            self.deep_thinking_llm = ChatOpenAI(model=self.config["deep_think_llm"], base_url=self.config["backend_url"])
-            self.quick_thinking_llm = ChatOpenAI(model=self.config["quick_think_llm"], base_url=self.config["backend_url"])
+            self.deep_thinking_llm = ChatOpenAI(model=self.config["deep_think_llm"], base_url=self.config["backend_url"], **llm_kwargs)
+            self.quick_thinking_llm = ChatOpenAI(model=self.config["quick_think_llm"], base_url=self.config["backend_url"], **llm_kwargs)
         elif self.config["llm_provider"].lower() == "anthropic":
-            self.deep_thinking_llm = ChatAnthropic(model=self.config["deep_think_llm"], base_url=self.config["backend_url"])
-            self.quick_thinking_llm = ChatAnthropic(model=self.config["quick_think_llm"], base_url=self.config["backend_url"])
+            self.deep_thinking_llm = ChatAnthropic(model=self.config["deep_think_llm"], base_url=self.config["backend_url"], **llm_kwargs)
+            self.quick_thinking_llm = ChatAnthropic(model=self.config["quick_think_llm"], base_url=self.config["backend_url"], **llm_kwargs)
         elif self.config["llm_provider"].lower() == "google":
-            self.deep_thinking_llm = ChatGoogleGenerativeAI(model=self.config["deep_think_llm"])
-            self.quick_thinking_llm = ChatGoogleGenerativeAI(model=self.config["quick_think_llm"])
+            self.deep_thinking_llm = ChatGoogleGenerativeAI(model=self.config["deep_think_llm"], **llm_kwargs)
+            self.quick_thinking_llm = ChatGoogleGenerativeAI(model=self.config["quick_think_llm"], **llm_kwargs)
         else:
             raise ValueError(f"Unsupported LLM provider: {self.config['llm_provider']}")
         
@@ -115,45 +131,140 @@ class TradingAgentsGraph:
         # State tracking
         self.curr_state = None
         self.ticker = None
-        self.log_states_dict = {}  # date to full state dict
+        self.log_states_dict = {}  # ticker to {date: full state dict}
+
+        # Set up the graph, with durable checkpoints when enabled
+        self.checkpointer = self._create_checkpointer()
+        self.graph = self.graph_setup.setup_graph(
+            selected_analysts,
+            parallel_analysts=self.config.get("parallel_analysts", False),
+            checkpointer=self.checkpointer,
+        )
 
-        # Set up the graph
-        self.graph = self.graph_setup.setup_graph(selected_analysts)
+    def _create_llm_cache(self) -> Optional[SQLiteLLMCache]:
+        """Create the LLM response cache configured under "llm_cache", if enabled."""
+        settings = self.config.get("llm_cache", {})
+        if not settings.get("enabled", False):
+            return None
+        path = settings.get("path") or os.path.join(
+            self.config["data_cache_dir"], "llm_cache.sqlite"
+        )
+        return SQLiteLLMCache(path, settings.get("max_size_mb", 256))
+
+    def get_llm_cache_stats(self) -> Optional[Dict[str, Any]]:
+        """Hit rates of the LLM response cache, overall and per graph node."""
+        return self.llm_cache.stats() if self.llm_cache is not None else None
+
+    def _create_checkpointer(self):
+        """Create the SQLite checkpointer configured under "checkpointing", if enabled."""
+        settings = self.config.get("checkpointing", {})
+        if not settings.get("enabled", False):
+            return None
+        try:
+            from langgraph.checkpoint.sqlite import SqliteSaver
+        except ImportError as e:
+            raise ImportError(
+                "Checkpointing requires langgraph-checkpoint-sqlite: "
+                "pip install langgraph-checkpoint-sqlite"
+            ) from e
+
+        path = settings.get("path") or os.path.join(
+            self.config["data_cache_dir"], "checkpoints.sqlite"
+        )
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        return SqliteSaver(sqlite3.connect(path, check_same_thread=False))
+
+    def _thread_id(self, company_name, trade_date) -> str:
+        """Checkpoint thread for a run: the ticker, the date and a hash of the config."""
+        settings = json.dumps(
+            {"config": self.config, "analysts": self.selected_analysts},
+            sort_keys=True,
+            default=str,
+        )
+        config_hash = hashlib.sha256(settings.encode("utf-8")).hexdigest()[:16]
+        return f"{company_name}:{trade_date}:{config_hash}"
 
-    def _create_tool_nodes(self) -> Dict[str, ToolNode]:
-        """Create tool nodes for different data sources using abstract methods."""
+    def get_graph_args(self, company_name, trade_date) -> Dict[str, Any]:
+        """Arguments for graph.invoke/stream, including the checkpoint thread if enabled."""
+        args = self.propagator.get_graph_args()
+        if self.checkpointer is not None:
+            args["config"]["configurable"] = {
+                "thread_id": self._thread_id(company_name, str(trade_date))
+            }
+        return args
+
+    def discard_checkpoint(self, company_name, trade_date) -> None:
+        """Delete the saved checkpoints of a run, if checkpointing is enabled."""
+        if self.checkpointer is not None:
+            self.checkpointer.delete_thread(self._thread_id(company_name, str(trade_date)))
+
+    def prune_checkpoint(self, company_name, trade_date) -> None:
+        """Drop a finished run's checkpoints unless "keep_completed" is set."""
+        if not self.config.get("checkpointing", {}).get("keep_completed", False):
+            self.discard_checkpoint(company_name, trade_date)
+
+    def _run_graph(self, graph_input, args):
+        """Run the graph to completion and return its final state."""
+        if self.debug:
+            # Debug mode with tracing
+            trace = []
+            for chunk in self.graph.stream(graph_input, **args):
+                if len(chunk["messages"]) == 0:
+                    pass
+                else:
+                    chunk["messages"][-1].pretty_print()
+                    trace.append(chunk)
+
+            return trace[-1]
+        # Standard mode without tracing
+        return self.graph.invoke(graph_input, **args)
+
+    def _create_tool_nodes(self) -> Dict[str, ConcurrentToolNode]:
+        """Create tool nodes for different data sources using abstract methods.
+
+        Tool calls made in one analyst turn run concurrently, up to
+        tool_concurrency at a time and tool_timeout seconds each.
+        """
+        options = {
+            "max_workers": self.config.get("tool_concurrency", 4),
+            "timeout": self.config.get("tool_timeout"),
+        }
         return {
-            "market": ToolNode(
+            "market": ConcurrentToolNode(
                 [
                     # Core stock data tools
                     get_stock_data,
                     # Technical indicators
                     get_indicators,
-                ]
+                ],
+                **options,
             ),
-            "social": ToolNode(
+            "social": ConcurrentToolNode(
                 [
                     # News tools for social media analysis
                     get_news,
-                ]
+                ],
+                **options,
             ),
-            "news": ToolNode(
+            "news": ConcurrentToolNode(
                 [
                     # News and insider information
                     get_news,
                     get_global_news,
                     get_insider_sentiment,
                     get_insider_transactions,
-                ]
+                ],
+                **options,
             ),
-            "fundamentals": ToolNode(
+            "fundamentals": ConcurrentToolNode(
                 [
                     # Fundamental analysis tools
                     get_fundamentals,
                     get_balance_sheet,
                     get_cashflow,
                     get_income_statement,
-                ]
+                ],
+                **options,
             ),
         }
 
@@ -166,22 +277,13 @@ class TradingAgentsGraph:
         init_agent_state = self.propagator.create_initial_state(
             company_name, trade_date
         )
-        args = self.propagator.get_graph_args()
+        args = self.get_graph_args(company_name, trade_date)
 
-        if self.debug:
-            # Debug mode with tracing
-            trace = []
-            for chunk in self.graph.stream(init_agent_state, **args):
-                if len(chunk["messages"]) == 0:
-                    pass
-                else:
-                    chunk["messages"][-1].pretty_print()
-                    trace.append(chunk)
+        # A new run replaces any checkpoints left by an earlier one
+        self.discard_checkpoint(company_name, trade_date)
 
-            final_state = trace[-1]
-        else:
-            # Standard mode without tracing
-            final_state = self.graph.invoke(init_agent_state, **args)
+        final_state = self._run_graph(init_agent_state, args)
+        self.prune_checkpoint(company_name, trade_date)
 
         # Store current state for reflection
         self.curr_state = final_state
@@ -192,9 +294,119 @@ class TradingAgentsGraph:
         # Return decision and processed signal
         return final_state, self.process_signal(final_state["final_trade_decision"])
 
+    def resume(self, company_name, trade_date):
+        """Continue an interrupted run from its last checkpoint.
+
+        Nodes that completed before the failure are not run again; the node
+        that failed is retried. Checkpoints of finished runs are deleted unless
+        "keep_completed" is set, in which case such a run returns its state.
+        """
+        if self.checkpointer is None:
+            raise ValueError("resume() requires checkpointing to be enabled in the config")
+
+        self.ticker = company_name
+        args = self.get_graph_args(company_name, trade_date)
+        snapshot = self.graph.get_state(args["config"])
+        if not snapshot.values:
+            raise ValueError(f"No checkpoint found for {company_name} on {trade_date}")
+
+        if snapshot.next:
+            final_state = self._run_graph(None, args)
+        else:
+            final_state = snapshot.values
+        self.prune_checkpoint(company_name, trade_date)
+
+        self.curr_state = final_state
+        self._log_state(trade_date, final_state)
+        return final_state, self.process_signal(final_state["final_trade_decision"])
+
+    async def apropagate(self, company_name, trade_date):
+        """Async version of propagate, running the graph with its async API.
+
+        Several calls can run on one event loop and share this instance's LLM
+        clients; curr_state and ticker reflect the run that finished last.
+        The SQLite checkpointer is synchronous, so with checkpointing enabled
+        the graph runs in a worker thread instead.
+        """
+        init_agent_state = self.propagator.create_initial_state(
+            company_name, trade_date
+        )
+        args = self.get_graph_args(company_name, trade_date)
+
+        if self.checkpointer is not None:
+            await asyncio.to_thread(self.discard_checkpoint, company_name, trade_date)
+            final_state = await asyncio.to_thread(self._run_graph, init_agent_state, args)
+            await asyncio.to_thread(self.prune_checkpoint, company_name, trade_date)
+        elif self.debug:
+            final_state = None
+            async for chunk in self.graph.astream(init_agent_state, **args):
+                if len(chunk["messages"]) > 0:
+                    chunk["messages"][-1].pretty_print()
+                    final_state = chunk
+        else:
+            final_state = await self.graph.ainvoke(init_agent_state, **args)
+
+        self.ticker = company_name
+        self.curr_state = final_state
+        self._log_state(trade_date, final_state)
+
+        decision = await self.signal_processor.aprocess_signal(
+            final_state["final_trade_decision"]
+        )
+        return final_state, decision
+
+    async def apropagate_many(
+        self,
+        jobs: Iterable[Tuple[str, str]],
+        max_concurrency: int = 4,
+    ) -> AsyncIterator[PropagationResult]:
+        """Run many (ticker, trade_date) jobs concurrently, yielding each as it finishes.
+
+        At most max_concurrency graphs run at once. A failed job is yielded
+        with its exception in `error` instead of stopping the batch.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run(ticker, trade_date):
+            async with semaphore:
+                try:
+                    final_state, decision = await self.apropagate(ticker, trade_date)
+                    return PropagationResult(ticker, str(trade_date), final_state, decision)
+                except Exception as e:
+                    return PropagationResult(ticker, str(trade_date), None, None, e)
+
+        tasks = [asyncio.ensure_future(run(ticker, trade_date)) for ticker, trade_date in jobs]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def propagate_many(
+        self,
+        jobs: Iterable[Tuple[str, str]],
+        max_concurrency: int = 4,
+    ) -> Iterator[PropagationResult]:
+        """Blocking version of apropagate_many for callers without an event loop."""
+        loop = asyncio.new_event_loop()
+        results = self.apropagate_many(jobs, max_concurrency)
+        try:
+            while True:
+                try:
+                    yield loop.run_until_complete(results.__anext__())
+                except StopAsyncIteration:
+                    break
+        finally:
+            loop.run_until_complete(results.aclose())
+            loop.run_until_complete(loop.shutdown_default_executor())
+            loop.close()
+
     def _log_state(self, trade_date, final_state):
         """Log the final state to a JSON file."""
-        self.log_states_dict[str(trade_date)] = {
+        ticker = final_state["company_of_interest"]
+        ticker_states = self.log_states_dict.setdefault(ticker, {})
+        ticker_states[str(trade_date)] = {
             "company_of_interest": final_state["company_of_interest"],
             "trade_date": final_state["trade_date"],
             "market_report": final_state["market_report"],
@@ -225,14 +437,14 @@ class TradingAgentsGraph:
         }
 
         # Save to file
-        directory = Path(f"eval_results/{self.ticker}/TradingAgentsStrategy_logs/")
+        directory = Path(f"eval_results/{ticker}/TradingAgentsStrategy_logs/")
         directory.mkdir(parents=True, exist_ok=True)
 
         with open(
-            f"eval_results/{self.ticker}/TradingAgentsStrategy_logs/full_states_log_{trade_date}.json",
+            f"eval_results/{ticker}/TradingAgentsStrategy_logs/full_states_log_{trade_date}.json",
             "w",
         ) as f:
-            json.dump(self.log_states_dict, f, indent=4)
+            json.dump(ticker_states, f, indent=4)
 
     def reflect_and_remember(self, returns_losses):
         """Reflect on decisions and update memory based on returns."""